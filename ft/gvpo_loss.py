@@ -125,6 +125,80 @@ class GVPOLoss:
         """
         return (token_log_probs * mask).sum(dim=-1)
 
+    @staticmethod
+    def _group_index(uid: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Map group identifiers to dense indices.
+
+        Args:
+            uid: Unique identifiers for grouping samples, shape (batch_size,)
+
+        Returns:
+            Tuple of (group_index, counts)
+            - group_index: Dense group index per sample, shape (batch_size,)
+            - counts: Number of samples per group, shape (num_groups,)
+        """
+        _, group_index, counts = torch.unique(
+            uid, return_inverse=True, return_counts=True
+        )
+        return group_index, counts
+
+    @staticmethod
+    def _group_sum(
+        values: torch.Tensor,
+        group_index: torch.Tensor,
+        num_groups: int,
+    ) -> torch.Tensor:
+        """Sum values per group with a single scatter_add, shape (num_groups,)."""
+        return torch.zeros(
+            num_groups, dtype=values.dtype, device=values.device
+        ).scatter_add_(0, group_index, values)
+
+    def _group_mean_std(
+        self,
+        values: torch.Tensor,
+        group_index: torch.Tensor,
+        counts: torch.Tensor,
+        unbiased: Optional[bool] = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Compute per-group mean and standard deviation in one pass.
+
+        Uses the E[x^2] - E[x]^2 form so that sum and sum of squares are
+        reduced together instead of a mean pass followed by a variance pass.
+
+        Args:
+            values: Values to reduce, shape (batch_size,)
+            group_index: Dense group index per sample, shape (batch_size,)
+            counts: Number of samples per group, shape (num_groups,)
+            unbiased: Use the (k-1) denominator; defaults to use_bessel_correction
+
+        Returns:
+            Tuple of (mean, std), each of shape (num_groups,)
+        """
+        num_groups = counts.shape[0]
+        sums = torch.zeros(
+            2, num_groups, dtype=values.dtype, device=values.device
+        ).scatter_add_(
+            1,
+            group_index.unsqueeze(0).expand(2, -1),
+            torch.stack([values, values * values]),
+        )
+        group_sum, group_sum_sq = sums[0], sums[1]
+
+        counts = counts.to(values.dtype)
+        mean = group_sum / counts
+        if unbiased is None:
+            unbiased = self.use_bessel_correction
+        if unbiased:
+            denominator = (counts - 1).clamp_min(1)
+        else:
+            denominator = counts
+        # Guard against small negative values from floating point cancellation
+        var = ((group_sum_sq - group_sum * mean) / denominator).clamp_min(0)
+
+        return mean, var.sqrt()
+
     def compute_gvpo_weights(
         self,
         rewards: torch.Tensor,
@@ -156,11 +230,11 @@ class GVPOLoss:
         # Compute log importance ratios
         log_ratios = log_probs - ref_log_probs
 
-        # Group samples by uid
-        unique_uids = torch.unique(uid)
-        batch_size = rewards.shape[0]
+        # Map each sample to a dense group index so that all per-group
+        # reductions can be done with a single scatter_add over the batch
+        group_index, counts = self._group_index(uid)
+        num_groups = counts.shape[0]
 
-        weights = torch.zeros_like(rewards)
         metrics = {
             'gvpo/mean_reward': 0.0,
             'gvpo/std_reward': 0.0,
@@ -172,43 +246,29 @@ class GVPOLoss:
             'gvpo/min_weight': 0.0,
         }
 
-        # Compute weights for each group
-        for uid_val in unique_uids:
-            # Find indices for this group
-            group_mask = (uid == uid_val)
-            group_indices = group_mask.nonzero(as_tuple=True)[0]
+        # Compute group means
+        mean_reward = self._group_sum(rewards, group_index, num_groups) / counts
+        mean_log_ratio = self._group_sum(log_ratios, group_index, num_groups) / counts
 
-            if len(group_indices) == 0:
-                continue
+        # Compute centered values
+        centered_rewards = rewards - mean_reward[group_index]
+        centered_log_ratios = log_ratios - mean_log_ratio[group_index]
 
-            # Get group data
-            group_rewards = rewards[group_indices]
-            group_log_ratios = log_ratios[group_indices]
+        # Compute GVPO weights: w_i = (R_i - R̄) - β(log_ratio_i - log_ratio_̄)
+        weights = centered_rewards - self.beta * centered_log_ratios
 
-            # Compute group means
-            mean_reward = group_rewards.mean()
-            mean_log_ratio = group_log_ratios.mean()
+        # Ensure zero-sum constraint (should be satisfied by construction, but enforce for numerical stability)
+        if self.normalize_weights:
+            mean_weight = self._group_sum(weights, group_index, num_groups) / counts
+            weights = weights - mean_weight[group_index]
 
-            # Compute centered values
-            centered_rewards = group_rewards - mean_reward
-            centered_log_ratios = group_log_ratios - mean_log_ratio
-
-            # Compute GVPO weights: w_i = (R_i - R̄) - β(log_ratio_i - log_ratio_̄)
-            group_weights = centered_rewards - self.beta * centered_log_ratios
-
-            # Ensure zero-sum constraint (should be satisfied by construction, but enforce for numerical stability)
-            if self.normalize_weights:
-                group_weights = group_weights - group_weights.mean()
-
-            # Optional clipping for stability
-            if self.clip_weight is not None:
-                group_weights = torch.clamp(
-                    group_weights,
-                    min=-self.clip_weight,
-                    max=self.clip_weight
-                )
-
-            weights[group_indices] = group_weights
+        # Optional clipping for stability
+        if self.clip_weight is not None:
+            weights = torch.clamp(
+                weights,
+                min=-self.clip_weight,
+                max=self.clip_weight
+            )
 
         # Compute metrics
         metrics['gvpo/mean_reward'] = rewards.mean().item()
@@ -286,23 +346,21 @@ class GVPOLoss:
 
         # For compatibility with PPO, we can normalize weights to have unit std
         # within each group (optional, can be disabled)
-        unique_uids = torch.unique(uid)
-        advantages = torch.zeros_like(weights)
-
-        for uid_val in unique_uids:
-            group_mask = (uid == uid_val)
-            group_indices = group_mask.nonzero(as_tuple=True)[0]
-
-            if len(group_indices) > 1:
-                group_weights = weights[group_indices]
-                # Normalize to unit std (optional)
-                group_std = group_weights.std()
-                if group_std > 1e-8:
-                    advantages[group_indices] = group_weights / group_std
-                else:
-                    advantages[group_indices] = group_weights
-            else:
-                advantages[group_indices] = 0.0
+        group_index, counts = self._group_index(uid)
+        # Always the unbiased std, matching torch.Tensor.std(); the Bessel
+        # setting only governs the loss normalization
+        _, group_std = self._group_mean_std(
+            weights, group_index, counts, unbiased=True
+        )
+        sample_std = group_std[group_index]
+
+        advantages = torch.where(
+            sample_std > 1e-8,
+            weights / sample_std.clamp_min(1e-8),
+            weights,
+        )
+        # Singleton groups carry no relative signal
+        advantages = advantages.masked_fill(counts[group_index] <= 1, 0.0)
 
         metrics['gvpo/advantage_mean'] = advantages.mean().item()
         metrics['gvpo/advantage_std'] = advantages.std().item()
@@ -18,6 +18,7 @@ Usage:
 
 import sys
 import os
+import logging
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -50,6 +51,8 @@ from agentflow.verl.trainer import AgentFlowTrainer
 # Import GVPO loss computation
 from ft.gvpo_loss import compute_gvpo_advantage, GVPOLoss
 
+logger = logging.getLogger(__name__)
+
 
 class GVPOAgentFlowTrainer(AgentFlowTrainer):
     """
@@ -88,14 +91,29 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
             normalize_weights=self.gvpo_normalize_weights,
         )
 
-        print(f"\n{'='*80}")
-        print(f"GVPO Trainer Initialized")
-        print(f"{'='*80}")
-        print(f"GVPO Beta (KL coefficient): {self.gvpo_beta}")
-        print(f"Use Bessel Correction: {self.gvpo_use_bessel_correction}")
-        print(f"Clip Weight: {self.gvpo_clip_weight}")
-        print(f"Normalize Weights: {self.gvpo_normalize_weights}")
-        print(f"{'='*80}\n")
+        # Cache hot-path config values as plain attributes; DictConfig attribute
+        # access goes through resolution logic on every lookup
+        self._mini_batch_size = self.config.actor_rollout_ref.actor.ppo_mini_batch_size
+        self._n_gpus_per_node = self.config.trainer.n_gpus_per_node
+        self._num_rollout_samples = self.config.actor_rollout_ref.rollout.n
+        self._use_kl_in_reward = bool(self.config.algorithm.use_kl_in_reward)
+        self._adv_estimator = self.config.algorithm.adv_estimator
+        self._balance_batch_enabled = self.config.trainer.balance_batch
+        self._critic_warmup = self.config.trainer.critic_warmup
+        self._max_prompt_length = self.config.data.max_prompt_length
+        self._max_response_length = self.config.data.max_response_length
+        self._loss_agg_mode = self.config.actor_rollout_ref.actor.loss_agg_mode
+        self._multi_turn = self.config.actor_rollout_ref.rollout.multi_turn.enable
+
+        # Log once from rank 0 instead of every worker writing to stdout
+        if not torch.distributed.is_initialized() or torch.distributed.get_rank() == 0:
+            logger.info(
+                "GVPO Trainer Initialized | beta=%s bessel=%s clip=%s normalize=%s",
+                self.gvpo_beta,
+                self.gvpo_use_bessel_correction,
+                self.gvpo_clip_weight,
+                self.gvpo_normalize_weights,
+            )
 
     def _compute_gvpo_advantages(self, batch: DataProto) -> DataProto:
         """
@@ -110,8 +128,11 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
             DataProto with advantages added
         """
         # Extract sequence-level values
+        # Prefer the sequence reward cached at reward time; otherwise
         # token_level_rewards should be summed to get total reward
-        if 'token_level_rewards' in batch.batch:
+        if 'sequence_reward' in batch.batch:
+            rewards = batch.batch['sequence_reward']
+        elif 'token_level_rewards' in batch.batch:
             rewards = batch.batch['token_level_rewards'].sum(dim=-1)
         else:
             raise ValueError("Batch must contain 'token_level_rewards'")
@@ -149,7 +170,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
             log_probs=log_probs,
             ref_log_probs=ref_log_probs,
             uid=uid,
-            num_samples=self.config.actor_rollout_ref.rollout.n,
+            num_samples=self._num_rollout_samples,
         )
 
         # Convert weights to advantages (expand to token-level)
@@ -219,8 +240,8 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                     raise ValueError("No training tasks completed.")
 
                 batch, agent_metrics = self.agent_mode_daemon.get_train_data_batch(
-                    max_prompt_length=self.config.data.max_prompt_length,
-                    max_response_length=self.config.data.max_response_length,
+                    max_prompt_length=self._max_prompt_length,
+                    max_response_length=self._max_response_length,
                     device=gen_batch.batch["fake_ids"].device,
                 )
                 metrics.update(agent_metrics)
@@ -228,7 +249,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                 self.async_rollout_manager.sleep()
 
             # Handle REMAX baseline if needed
-            if self.config.algorithm.adv_estimator == AdvantageEstimator.REMAX:
+            if self._adv_estimator == AdvantageEstimator.REMAX:
                 with _timer("gen_max", timing_raw):
                     gen_baseline_batch = deepcopy(gen_batch)
                     gen_baseline_batch.meta_info["do_sample"] = False
@@ -272,7 +293,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                 old_log_prob = self.actor_rollout_wg.compute_log_prob(batch)
                 entropys = old_log_prob.batch["entropys"]
                 response_masks = batch.batch["response_mask"]
-                loss_agg_mode = self.config.actor_rollout_ref.actor.loss_agg_mode
+                loss_agg_mode = self._loss_agg_mode
                 entropy_loss = agg_loss(
                     loss_mat=entropys,
                     loss_mask=response_masks,
@@ -303,7 +324,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
             # ============================================================
             with _timer("adv", timing_raw):
                 # Apply KL penalty to rewards if configured
-                if self.config.algorithm.use_kl_in_reward:
+                if self._use_kl_in_reward:
                     batch, kl_metrics = apply_kl_penalty(
                         batch,
                         kl_ctrl=self.kl_ctrl_in_reward,
@@ -313,8 +334,11 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                 else:
                     batch.batch["token_level_rewards"] = batch.batch["token_level_scores"]
 
+                # Reduce token rewards to a sequence reward once per step
+                batch.batch["sequence_reward"] = batch.batch["token_level_rewards"].sum(dim=-1)
+
                 # Use GVPO for advantage computation
-                if self.config.algorithm.adv_estimator == 'gvpo':
+                if self._adv_estimator == 'gvpo':
                     batch = self._compute_gvpo_advantages(batch)
                     # Add GVPO metrics
                     if 'metrics' in batch.meta_info:
@@ -324,10 +348,10 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                     from verl.trainer.ppo.ray_trainer import compute_advantage
                     batch = compute_advantage(
                         batch,
-                        adv_estimator=self.config.algorithm.adv_estimator,
+                        adv_estimator=self._adv_estimator,
                         gamma=self.config.algorithm.gamma,
                         lam=self.config.algorithm.lam,
-                        num_repeat=self.config.actor_rollout_ref.rollout.n,
+                        num_repeat=self._num_rollout_samples,
                         norm_adv_by_std_in_grpo=self.config.algorithm.get(
                             "norm_adv_by_std_in_grpo", True
                         ),
@@ -335,7 +359,10 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                     )
 
             # Drop samples and balance batch
-            keep_indices = (~batch.batch["is_drop_mask"]).nonzero(as_tuple=True)[0]
+            # int32 indices halve the index bytes read by the gather
+            keep_indices = (
+                (~batch.batch["is_drop_mask"]).nonzero(as_tuple=True)[0].to(torch.int32)
+            )
             metrics["agent_mode/n_dropped_sample_because_of_prompt"] = (
                 batch.batch["is_drop_mask"].shape[0] - keep_indices.shape[0]
             )
@@ -343,7 +370,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
 
             # Round to mini-batch size
             import random
-            mini_batch_size = self.config.actor_rollout_ref.actor.ppo_mini_batch_size
+            mini_batch_size = self._mini_batch_size
             n_transition = len(batch)
 
             random_indices = list(range(n_transition))
@@ -357,7 +384,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
 
             n_transition = len(batch)
             # Make divisible by k_partitions
-            k_partitions = self.config.trainer.n_gpus_per_node
+            k_partitions = self._n_gpus_per_node
             n_remained_transition = n_transition // k_partitions * k_partitions
             if n_remained_transition != n_transition:
                 batch = batch[list(range(n_remained_transition))]
@@ -366,7 +393,7 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
             )
 
             # Balance batch
-            if self.config.trainer.balance_batch:
+            if self._balance_batch_enabled:
                 self._balance_batch(batch, metrics=metrics)
 
             # Update critic
@@ -377,11 +404,9 @@ class GVPOAgentFlowTrainer(AgentFlowTrainer):
                 metrics.update(critic_output_metrics)
 
             # Update actor (after critic warmup)
-            if self.config.trainer.critic_warmup <= self.global_steps:
+            if self._critic_warmup <= self.global_steps:
                 with _timer("update_actor", timing_raw):
-                    batch.meta_info["multi_turn"] = (
-                        self.config.actor_rollout_ref.rollout.multi_turn.enable
-                    )
+                    batch.meta_info["multi_turn"] = self._multi_turn
                     actor_output = self.actor_rollout_wg.update_actor(batch)
                 actor_output_metrics = reduce_metrics(actor_output.meta_info["metrics"])
                 metrics.update(actor_output_metrics)
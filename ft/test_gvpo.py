@@ -118,6 +118,70 @@ class TestGVPOLoss(unittest.TestCase):
         self.assertIn('gvpo/advantage_mean', metrics)
         self.assertIn('gvpo/advantage_std', metrics)
 
+    def test_advantage_matches_per_group_reference(self):
+        """Test fused group statistics against a per-group reference."""
+        # Uneven groups, including a singleton group
+        rewards = torch.randn(9)
+        log_probs = torch.randn(9)
+        ref_log_probs = torch.randn(9)
+        uid = torch.tensor([2, 0, 2, 0, 1, 2, 0, 2, 3])
+
+        weights, _ = self.gvpo.compute_gvpo_weights(
+            rewards, log_probs, ref_log_probs, uid, 4
+        )
+        advantages, _ = self.gvpo.compute_advantages(
+            rewards, log_probs, ref_log_probs, uid, 4
+        )
+
+        log_ratios = log_probs - ref_log_probs
+        for uid_val in torch.unique(uid):
+            group_mask = (uid == uid_val)
+            group_rewards = rewards[group_mask]
+            group_log_ratios = log_ratios[group_mask]
+            expected = (group_rewards - group_rewards.mean()) - self.gvpo.beta * (
+                group_log_ratios - group_log_ratios.mean()
+            )
+            self.assertTrue(torch.allclose(weights[group_mask], expected, atol=1e-6))
+
+            if group_mask.sum() > 1:
+                expected_adv = expected / expected.std()
+            else:
+                expected_adv = torch.zeros_like(expected)
+            self.assertTrue(
+                torch.allclose(advantages[group_mask], expected_adv, atol=1e-5)
+            )
+
+    def test_advantage_matches_loop_without_bessel_correction(self):
+        """Test advantages match the per-group loop regardless of Bessel setting."""
+        gvpo = GVPOLoss(beta=0.1, use_bessel_correction=False)
+        uid = torch.tensor([2, 0, 2, 0, 1, 2, 0, 2, 3])
+        rewards = torch.randn(9)
+        log_probs = torch.randn(9)
+        ref_log_probs = torch.randn(9)
+
+        weights, _ = gvpo.compute_gvpo_weights(
+            rewards, log_probs, ref_log_probs, uid, 4
+        )
+        advantages, _ = gvpo.compute_advantages(
+            rewards, log_probs, ref_log_probs, uid, 4
+        )
+
+        # Reference: the original per-group loop, which used Tensor.std()
+        expected = torch.zeros_like(weights)
+        for uid_val in torch.unique(uid):
+            group_indices = (uid == uid_val).nonzero(as_tuple=True)[0]
+            if len(group_indices) > 1:
+                group_weights = weights[group_indices]
+                group_std = group_weights.std()
+                if group_std > 1e-8:
+                    expected[group_indices] = group_weights / group_std
+                else:
+                    expected[group_indices] = group_weights
+            else:
+                expected[group_indices] = 0.0
+
+        self.assertTrue(torch.allclose(advantages, expected, atol=1e-5))
+
     def test_bessel_correction(self):
         """Test Bessel correction in loss computation."""
         gvpo_bessel = GVPOLoss(beta=0.1, use_bessel_correction=True)
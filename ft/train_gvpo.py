@@ -20,47 +20,177 @@ Features:
 
 import sys
 import os
+import copy
+import functools
+import hashlib
+import json
+import re
+from collections import OrderedDict
 from pathlib import Path
-import yaml
 import argparse
-from typing import Dict, Any
-import subprocess
+from typing import Dict, Any, Tuple
 
 # Add parent directory to Python path
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
+# Parsed configs keyed by absolute path, validated by (mtime, size)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
 
-def load_config(config_path: str) -> Dict[str, Any]:
+def _banner(title: str, trailing_newline: bool = False) -> None:
+    """Write a section banner with a single stdout write."""
+    bar = '=' * 80
+    sys.stdout.write(f"\n{bar}\n{title}\n{bar}\n" + ("\n" if trailing_newline else ""))
+
+
+# Environment variable names whose values are masked when displayed
+_SENSITIVE_KEY = re.compile(r'(?:KEY|TOKEN|PASSWORD|SECRET|CREDENTIAL)', re.IGNORECASE)
+
+
+# The environment is final once setup_environment has run, so expansions
+# of identical strings can be shared for the rest of the launch
+_expandvars = functools.lru_cache(maxsize=256)(os.path.expandvars)
+
+# Suffix of the JSON parse cache written next to the YAML file
+JSON_CACHE_SUFFIX = '.cache.json'
+
+
+def _read_json_cache(cache_path: str, yaml_mtime: float, content_version: str) -> Any:
+    """
+    Read a sibling JSON parse cache if it is still valid.
+
+    Args:
+        cache_path: Path to the JSON cache file
+        yaml_mtime: Modification time of the YAML file
+        content_version: Hash of the current YAML content
+
+    Returns:
+        Cached configuration, or None if missing, stale or unreadable
+    """
+    try:
+        if os.stat(cache_path).st_mtime < yaml_mtime:
+            return None
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Catch edits that preserve mtime
+    if not isinstance(cached, dict) or cached.get('content_version') != content_version:
+        return None
+    return cached.get('config')
+
+
+def _write_json_cache(
+    cache_path: str, content_version: str, config: Any, mode: int
+) -> None:
+    """
+    Write the sibling JSON parse cache, ignoring unwritable locations.
+
+    Args:
+        cache_path: Path to the JSON cache file
+        content_version: Hash of the YAML content the config was parsed from
+        config: Parsed configuration
+        mode: Permission bits of the YAML file (the cache holds its env secrets)
+    """
+    try:
+        payload = json.dumps({'content_version': content_version, 'config': config})
+        fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode & 0o777)
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+    except (OSError, TypeError, ValueError):
+        # Read-only checkout or YAML types JSON can't represent
+        pass
+
+
+class ConfigParseError(Exception):
+    """Raised when a configuration file contains invalid YAML."""
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """
+    Import PyYAML on first use and pick the fastest safe loader.
+
+    PyYAML is only needed when the JSON parse cache misses, so it stays out
+    of the --help and cache-hit paths.
+
+    Returns:
+        Tuple of (yaml module, loader class)
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+        print("⚠ libyaml not available, using the slower pure-Python YAML parser "
+              "(reinstall PyYAML with libyaml support to speed up config loading)")
+    return yaml, SafeLoader
+
+
+def load_config(config_path: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    A sibling '<config>.cache.json' holding the parsed result is reused on
+    later runs while it is newer than the YAML file and its content hash
+    still matches.
+
     Args:
         config_path: Path to YAML configuration file
+        use_cache: Read and write the sibling JSON parse cache
 
     Returns:
         Configuration dictionary
 
     Raises:
         FileNotFoundError: If config file doesn't exist
-        yaml.YAMLError: If config file has invalid YAML
+        ConfigParseError: If config file has invalid YAML
     """
-    print(f"\n{'='*80}")
-    print(f"Loading Configuration")
-    print(f"{'='*80}")
+    _banner("Loading Configuration")
     print(f"Config file: {config_path}")
 
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
+    # Single stat serves both the existence check and the cache key
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        print(f"✓ Configuration loaded successfully")
-        return config
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Error parsing YAML file: {e}")
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+    key = os.path.abspath(config_path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        _YAML_CACHE.move_to_end(key)
+        print(f"✓ Configuration loaded from cache")
+        # Callers mutate the config (env expansion, overrides)
+        return copy.deepcopy(cached[2])
+
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    content_version = hashlib.md5(content).hexdigest()[:16]
+    cache_path = config_path + JSON_CACHE_SUFFIX
+
+    config = None
+    if use_cache:
+        config = _read_json_cache(cache_path, st.st_mtime, content_version)
+
+    if config is None:
+        yaml, SafeLoader = _yaml_loader()
+        try:
+            # Bytes go straight to the scanner without a decoded str copy
+            config = yaml.load(content, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            raise ConfigParseError(f"Error parsing YAML file: {e}")
+        if use_cache:
+            _write_json_cache(cache_path, content_version, config, st.st_mode)
+
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, config)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.pop(next(iter(_YAML_CACHE)))
+
+    print(f"✓ Configuration loaded successfully")
+    return copy.deepcopy(config)
 
 
 def setup_environment(env_config: Dict[str, Any]) -> None:
@@ -70,18 +200,17 @@ def setup_environment(env_config: Dict[str, Any]) -> None:
     Args:
         env_config: Dictionary of environment variables
     """
-    print(f"\n{'='*80}")
-    print(f"Setting Up Environment")
-    print(f"{'='*80}")
+    _banner("Setting Up Environment")
 
-    for key, value in env_config.items():
-        # Convert non-string values to strings
-        str_value = str(value)
-        os.environ[key] = str_value
+    # Convert non-string values to strings and apply in one batch
+    env_values = {key: str(value) for key, value in env_config.items()}
+    os.environ.update(env_values)
 
+    for key, str_value in env_values.items():
         # Mask sensitive keys
-        if 'KEY' in key or 'TOKEN' in key or 'PASSWORD' in key:
-            display_value = '***' + str_value[-4:] if len(str_value) > 4 else '***'
+        if _SENSITIVE_KEY.search(key):
+            # Only reveal a suffix when the value is long enough not to leak most of it
+            display_value = '***' + str_value[-4:] if len(str_value) >= 8 else '***'
         else:
             display_value = str_value
 
@@ -100,9 +229,7 @@ def validate_config(config: Dict[str, Any]) -> None:
     Raises:
         ValueError: If configuration is invalid
     """
-    print(f"\n{'='*80}")
-    print(f"Validating Configuration")
-    print(f"{'='*80}")
+    _banner("Validating Configuration")
 
     required_sections = ['env', 'python_args']
     for section in required_sections:
@@ -145,9 +272,7 @@ def build_command(config: Dict[str, Any], overrides: list) -> list:
     Returns:
         Command list for subprocess
     """
-    print(f"\n{'='*80}")
-    print(f"Building Training Command")
-    print(f"{'='*80}")
+    _banner("Building Training Command")
 
     # Base command - use agentflow.verl with GVPO trainer
     command = ["python", "-m", "agentflow.verl"]
@@ -157,7 +282,7 @@ def build_command(config: Dict[str, Any], overrides: list) -> list:
     for key, value in python_args.items():
         # Expand environment variables in values
         if isinstance(value, str):
-            expanded_value = os.path.expandvars(value)
+            expanded_value = _expandvars(value)
             command.append(f"{key}={expanded_value}")
         else:
             command.append(f"{key}={value}")
@@ -166,25 +291,40 @@ def build_command(config: Dict[str, Any], overrides: list) -> list:
     command.extend(overrides)
 
     print("Command:")
-    print("  " + " \\\n    ".join([str(item) for item in command]))
+    # Every item is already a str (base args, f-strings and argv overrides)
+    print("  " + " \\\n    ".join(command))
     print(f"✓ Command built")
 
     return command
 
 
-def run_training(command: list) -> int:
+def run_training(command: list, wrap: bool = False) -> int:
     """
     Run training command.
 
+    By default the launcher process is replaced by the training process,
+    so it does not sit idle in wait() for the whole run and signals go
+    straight to training. With wrap=True training runs as a child process.
+
     Args:
         command: Training command list
+        wrap: Run training as a subprocess and return its exit code
 
     Returns:
-        Exit code from training process
+        Exit code from training process (only returns if wrap=True or exec fails)
     """
-    print(f"\n{'='*80}")
-    print(f"Starting GVPO Training")
-    print(f"{'='*80}\n")
+    _banner("Starting GVPO Training", trailing_newline=True)
+
+    if not wrap:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvpe(command[0], command, os.environ)
+        except OSError as e:
+            print(f"\n\n✗ Error during training: {e}")
+            return 1
+
+    import subprocess
 
     try:
         # Run training with environment variables
@@ -242,6 +382,18 @@ Examples:
         help='Print command without executing'
     )
 
+    parser.add_argument(
+        '--wrap',
+        action='store_true',
+        help='Run training as a child process and report its exit status'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the JSON parse cache next to the config file'
+    )
+
     parser.add_argument(
         'overrides',
         nargs='*',
@@ -256,7 +408,7 @@ Examples:
 
     try:
         # Load configuration
-        config = load_config(args.config)
+        config = load_config(args.config, use_cache=not args.no_cache)
 
         # Set up environment
         if 'env' in config:
@@ -266,22 +418,18 @@ Examples:
         validate_config(config)
 
         if args.validate_only:
-            print(f"\n{'='*80}")
-            print(f"✓ Configuration validation passed")
-            print(f"{'='*80}\n")
+            _banner("✓ Configuration validation passed", trailing_newline=True)
             return 0
 
         # Build command
         command = build_command(config, args.overrides)
 
         if args.dry_run:
-            print(f"\n{'='*80}")
-            print(f"✓ Dry run complete (command not executed)")
-            print(f"{'='*80}\n")
+            _banner("✓ Dry run complete (command not executed)", trailing_newline=True)
             return 0
 
         # Run training
-        exit_code = run_training(command)
+        exit_code = run_training(command, wrap=args.wrap)
 
         # Print final status
         print(f"\n{'='*80}")
@@ -299,7 +447,7 @@ Examples:
     except ValueError as e:
         print(f"\n✗ Configuration Error: {e}")
         return 1
-    except yaml.YAMLError as e:
+    except ConfigParseError as e:
         print(f"\n✗ YAML Error: {e}")
         return 1
     except KeyboardInterrupt:
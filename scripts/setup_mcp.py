@@ -5,10 +5,61 @@ Setup script for MCP configuration in AgentFlow
 Creates default MCP configuration files and validates setup.
 """
 
-import os
 import json
 import sys
 from pathlib import Path
+from shutil import which
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+MCP_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["mcpServers"],
+    "properties": {
+        "mcpServers": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "properties": {
+                    "command": {"type": "string"},
+                    "args": {"type": "array", "items": {"type": "string"}},
+                    "env": {"type": "object", "additionalProperties": {"type": "string"}},
+                    "disabled": {"type": "boolean"},
+                    "autoApprove": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+        },
+    },
+}
+
+try:
+    import fastjsonschema
+
+    # Compiled once into a straight-line validator function
+    _validate_schema = fastjsonschema.compile(MCP_CONFIG_SCHEMA)
+    _SchemaError = fastjsonschema.JsonSchemaException
+except ImportError:
+    class _SchemaError(ValueError):
+        """Raised by the fallback validator"""
+
+    def _validate_schema(config):
+        if not isinstance(config, dict) or "mcpServers" not in config:
+            raise _SchemaError("missing 'mcpServers' key")
+        for server_name, server_config in config["mcpServers"].items():
+            if not isinstance(server_config, dict):
+                raise _SchemaError(f"server '{server_name}' must be an object")
+        return config
 
 
 def create_default_config(config_path: str, force: bool = False) -> bool:
@@ -72,8 +123,7 @@ def create_default_config(config_path: str, force: bool = False) -> bool:
     config_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Write config
-    with open(config_file, 'w') as f:
-        json.dump(default_config, f, indent=2)
+    config_file.write_bytes(_dumps(default_config))
     
     print(f"✓ Created MCP config: {config_path}")
     return True
@@ -96,11 +146,12 @@ def validate_config(config_path: str) -> bool:
         return False
     
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = _loads(config_file.read_bytes())
         
-        if "mcpServers" not in config:
-            print(f"❌ Invalid config: missing 'mcpServers' key")
+        try:
+            _validate_schema(config)
+        except _SchemaError as e:
+            print(f"❌ Invalid config: {e}")
             return False
         
         servers = config["mcpServers"]
@@ -128,7 +179,7 @@ def check_dependencies() -> None:
     print("\nChecking dependencies...")
     
     # Check npx
-    npx_available = os.system("which npx > /dev/null 2>&1") == 0
+    npx_available = which("npx") is not None
     if npx_available:
         print("✓ npx is installed (Node.js MCP servers)")
     else:
@@ -136,7 +187,7 @@ def check_dependencies() -> None:
         print("   https://nodejs.org/")
     
     # Check uvx
-    uvx_available = os.system("which uvx > /dev/null 2>&1") == 0
+    uvx_available = which("uvx") is not None
     if uvx_available:
         print("✓ uvx is installed (Python MCP servers)")
     else:
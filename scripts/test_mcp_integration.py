@@ -5,22 +5,28 @@ Verifies that MCP tools can be loaded and configured correctly.
 """
 
 import asyncio
+import functools
 import json
 import os
 from pathlib import Path
 
 
+@functools.cache
+def _shared_config():
+    """Load MCP configuration once per test run (callers must not mutate it)"""
+    from agentflow.mcp import MCPConfig
+    return MCPConfig()
+
+
 async def test_mcp_config():
     """Test MCP configuration loading"""
     print("=" * 60)
     print("Test 1: MCP Configuration")
     print("=" * 60)
     
-    from agentflow.mcp import MCPConfig
-    
     # Test 1: Create config from dict
     print("\n1. Testing configuration creation...")
-    config = MCPConfig()
+    config = _shared_config()
     print(f"✓ MCPConfig created")
     print(f"  Servers loaded: {len(config.get_all_servers())}")
     
@@ -48,11 +54,11 @@ async def test_mcp_tool_loader():
     print("Test 2: MCP Tool Loader")
     print("=" * 60)
     
-    from agentflow.mcp import MCPToolLoader, MCPConfig
+    from agentflow.mcp import MCPToolLoader
     
     # Test 1: Create loader
     print("\n1. Testing tool loader creation...")
-    config = MCPConfig()
+    config = _shared_config()
     loader = MCPToolLoader(config)
     print(f"✓ MCPToolLoader created")
     
@@ -207,12 +213,20 @@ async def main():
     print()
     
     try:
-        # Run tests
-        await test_mcp_config()
+        # Run independent tests concurrently
+        results = await asyncio.gather(
+            test_mcp_config(),
+            test_config_creation(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        
+        # Tests that share loader/executor state run in order
         await test_mcp_tool_loader()
         await test_executor_mcp_integration()
         await test_solver_mcp_integration()
-        await test_config_creation()
         
         # Summary
         print("\n" + "=" * 60)
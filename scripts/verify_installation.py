@@ -4,7 +4,9 @@ Verification script for AgentFlow installation
 """
 
 import sys
-import subprocess
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 
@@ -16,6 +18,13 @@ def check_python_version() -> Tuple[bool, str]:
     return False, f"✗ Python {version.major}.{version.minor} (3.10+ required)"
 
 
+def check_installed(module_name: str) -> Tuple[bool, str]:
+    """Check if module is installed without executing it"""
+    if importlib.util.find_spec(module_name) is not None:
+        return True, f"✓ {module_name} installed"
+    return False, f"✗ {module_name} not found"
+
+
 def check_import(module_name: str) -> Tuple[bool, str]:
     """Check if module can be imported"""
     try:
@@ -27,6 +36,8 @@ def check_import(module_name: str) -> Tuple[bool, str]:
 
 def check_aws_cli() -> Tuple[bool, str]:
     """Check AWS CLI"""
+    import subprocess
+    
     try:
         result = subprocess.run(
             ["aws", "--version"],
@@ -42,8 +53,31 @@ def check_aws_cli() -> Tuple[bool, str]:
         return False, "✗ AWS CLI not found"
 
 
-def check_aws_credentials() -> Tuple[bool, str]:
-    """Check AWS credentials"""
+_boto3_lock = threading.Lock()
+_boto3_session = None
+
+
+def _boto3_client(service_name: str, **kwargs):
+    """Create a client from one shared boto3 session"""
+    global _boto3_session
+    import boto3
+    from botocore.config import Config
+    
+    # Sessions are not thread-safe and the AWS checks run concurrently
+    with _boto3_lock:
+        if _boto3_session is None:
+            _boto3_session = boto3.Session()
+        return _boto3_session.client(
+            service_name,
+            config=Config(connect_timeout=5, read_timeout=10, retries={"max_attempts": 1}),
+            **kwargs
+        )
+
+
+def _check_aws_credentials_cli() -> Tuple[bool, str]:
+    """Check AWS credentials via the AWS CLI"""
+    import subprocess
+    
     try:
         result = subprocess.run(
             ["aws", "sts", "get-caller-identity"],
@@ -58,8 +92,10 @@ def check_aws_credentials() -> Tuple[bool, str]:
         return False, "✗ Cannot verify AWS credentials"
 
 
-def check_bedrock_access() -> Tuple[bool, str]:
-    """Check Bedrock access"""
+def _check_bedrock_access_cli() -> Tuple[bool, str]:
+    """Check Bedrock access via the AWS CLI"""
+    import subprocess
+    
     try:
         result = subprocess.run(
             ["aws", "bedrock", "list-foundation-models", "--region", "us-east-1"],
@@ -74,6 +110,30 @@ def check_bedrock_access() -> Tuple[bool, str]:
         return False, "✗ Cannot verify Bedrock access"
 
 
+def check_aws_credentials() -> Tuple[bool, str]:
+    """Check AWS credentials"""
+    if importlib.util.find_spec("boto3") is None:
+        return _check_aws_credentials_cli()
+    
+    try:
+        _boto3_client("sts").get_caller_identity()
+        return True, "✓ AWS credentials configured"
+    except Exception:
+        return False, "✗ AWS credentials not configured"
+
+
+def check_bedrock_access() -> Tuple[bool, str]:
+    """Check Bedrock access"""
+    if importlib.util.find_spec("boto3") is None:
+        return _check_bedrock_access_cli()
+    
+    try:
+        _boto3_client("bedrock", region_name="us-east-1").list_foundation_models()
+        return True, "✓ Bedrock accessible"
+    except Exception:
+        return False, "✗ Bedrock not accessible"
+
+
 def main():
     """Run all verification checks"""
     print("=" * 60)
@@ -83,21 +143,36 @@ def main():
     
     checks = [
         ("Python Version", check_python_version),
-        ("boto3", lambda: check_import("boto3")),
-        ("pydantic", lambda: check_import("pydantic")),
-        ("structlog", lambda: check_import("structlog")),
-        ("tenacity", lambda: check_import("tenacity")),
+        ("boto3", lambda: check_installed("boto3")),
+        ("pydantic", lambda: check_installed("pydantic")),
+        ("structlog", lambda: check_installed("structlog")),
+        ("tenacity", lambda: check_installed("tenacity")),
+        # AgentFlow is imported for real to confirm it loads cleanly
         ("AgentFlow", lambda: check_import("agentflow")),
+    ]
+    
+    # Independent network/subprocess-bound checks
+    aws_checks = [
         ("AWS CLI", check_aws_cli),
         ("AWS Credentials", check_aws_credentials),
         ("Bedrock Access", check_bedrock_access),
     ]
     
     results = []
-    for name, check_func in checks:
-        success, message = check_func()
-        results.append((success, message))
-        print(f"{message}")
+    with ThreadPoolExecutor(max_workers=len(aws_checks)) as executor:
+        # Start the AWS checks first so they overlap with the local ones
+        futures = [executor.submit(check_func) for _, check_func in aws_checks]
+        
+        for name, check_func in checks:
+            success, message = check_func()
+            results.append((success, message))
+            print(f"{message}")
+        
+        # Collect in submission order to keep output stable
+        for future in futures:
+            success, message = future.result()
+            results.append((success, message))
+            print(f"{message}")
     
     print()
     print("=" * 60)
@@ -1,20 +0,0 @@
-"""
-AgentFlow - Structured Agentic Workflows with Amazon Strands and Bedrock
-"""
-
-from agentflow.core.workflow import Workflow, WorkflowConfig
-from agentflow.core.agent import Agent, AgentConfig
-from agentflow.models.bedrock_client import BedrockClient, ModelType
-from agentflow.patterns.reasoning import ReasoningPattern
-
-__version__ = "0.1.0"
-
-__all__ = [
-    "Workflow",
-    "WorkflowConfig",
-    "Agent",
-    "AgentConfig",
-    "BedrockClient",
-    "ModelType",
-    "ReasoningPattern",
-]
@@ -1,15 +0,0 @@
-"""Core components for AgentFlow"""
-
-from agentflow.core.workflow import Workflow, WorkflowConfig, WorkflowStatus
-from agentflow.core.agent import Agent, AgentConfig, SimpleAgent, ToolAgent, ReasoningAgent
-
-__all__ = [
-    "Workflow",
-    "WorkflowConfig",
-    "WorkflowStatus",
-    "Agent",
-    "AgentConfig",
-    "SimpleAgent",
-    "ToolAgent",
-    "ReasoningAgent",
-]
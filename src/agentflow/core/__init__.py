@@ -1,10 +1,11 @@
 """Core components for AgentFlow"""
 
-from agentflow.core.workflow import Workflow, WorkflowConfig, WorkflowStatus
+from agentflow.core.workflow import Workflow, StrandsWorkflow, WorkflowConfig, WorkflowStatus
 from agentflow.core.agent import Agent, AgentConfig, SimpleAgent, ToolAgent, ReasoningAgent
 
 __all__ = [
     "Workflow",
+    "StrandsWorkflow",
     "WorkflowConfig",
     "WorkflowStatus",
     "Agent",
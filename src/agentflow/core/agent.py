@@ -14,6 +14,10 @@ from agentflow.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Line prefixes recognised in reasoning output
+_STEP_PREFIXES = ("Step", "Thought")
+_ANSWER_PREFIXES = ("Answer:", "Final Answer:")
+
 
 @dataclass
 class AgentConfig:
@@ -204,14 +208,13 @@ class ReasoningAgent(Agent):
         text = response.get("content", [{}])[0].get("text", "")
         
         # Parse reasoning steps and final answer
-        lines = text.split("\n")
         reasoning_steps = []
         final_answer = ""
         
-        for line in lines:
-            if line.startswith("Step") or line.startswith("Thought"):
+        for line in text.splitlines():
+            if line.startswith(_STEP_PREFIXES):
                 reasoning_steps.append(line)
-            elif line.startswith("Answer:") or line.startswith("Final Answer:"):
+            elif line.startswith(_ANSWER_PREFIXES):
                 final_answer = line.split(":", 1)[1].strip()
         
         return {
@@ -2,18 +2,25 @@
 Agent implementation for AgentFlow using Amazon Strands SDK
 """
 
+import hashlib
+import inspect
+import json
+import logging
+import re
+import string
 import uuid
-from typing import Any, Dict, Optional, List, Callable
-from dataclasses import dataclass, field
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Callable, FrozenSet, Mapping, Tuple
+from dataclasses import dataclass, field, replace
 from abc import ABC, abstractmethod
 import asyncio
+from botocore.exceptions import ClientError, ConnectTimeoutError, ReadTimeoutError
 from tenacity import (
-    retry,
+    AsyncRetrying,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-    after_log
+    retry_if_exception,
 )
 
 from agentflow.models.bedrock_client import BedrockClient, ModelType
@@ -23,10 +30,62 @@ from agentflow.utils.exceptions import AgentExecutionError
 
 logger = setup_logger(__name__)
 
+# The log level is fixed at configuration time, so hot-path debug calls are
+# skipped outright instead of building their keyword arguments
+_DEBUG = logger.is_enabled_for(logging.DEBUG)
 
-@dataclass
+# Reasoning step lines (group 1) and final answer text (group 2), one scan per response
+_REASONING_RE = re.compile(r"^(?:((?:Step|Thought)[^\n]*)|(?:Final )?Answer:([^\n]*))", re.MULTILINE)
+
+
+class _FrozenDict(dict):
+    """
+    Immutable, hashable dict for AgentConfig's nested values
+
+    Still a dict, so json.dumps and ** unpacking accept it unchanged.
+    """
+    
+    __slots__ = ()
+    
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+    
+    def __reduce__(self):
+        # The default reduction refills the dict through __setitem__
+        return (_FrozenDict, (dict(self),))
+    
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("AgentConfig values are immutable; use dataclasses.replace()")
+    
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert mappings, lists and sets to hashable equivalents"""
+    if isinstance(value, _FrozenDict):
+        return value
+    if isinstance(value, Mapping):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+_EMPTY_METADATA: Mapping[str, Any] = _FrozenDict()
+
+
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
-    """Configuration for an agent"""
+    """
+    Configuration for an agent
+    
+    Immutable and hashable; use dataclasses.replace() to derive a modified
+    copy. Tools and metadata are frozen deeply: mappings become read-only
+    dicts and lists become tuples.
+    """
     name: str
     description: str = ""
     model_type: ModelType = ModelType.SONNET_4_5
@@ -34,10 +93,99 @@ class AgentConfig:
     max_tokens: int = 4096
     system_prompt: Optional[str] = None
     reasoning_pattern: Optional[ReasoningPattern] = None
-    tools: List[Dict[str, Any]] = field(default_factory=list)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    tools: Tuple[Mapping[str, Any], ...] = ()
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA)
     max_retries: int = 3
     retry_delay: float = 1.0
+    prompt_caching: bool = True
+    max_parallel_tools: int = 8
+    cache: Optional["ResponseCache"] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, "tools", _freeze(tuple(self.tools)))
+        object.__setattr__(self, "metadata", _freeze(self.metadata))
+
+
+class ResponseCache:
+    """
+    LRU cache of model responses for repeated prompts
+    
+    Keys are digests of the final prompt together with the model, system
+    prompt, sampling settings and tools, so one cache can be shared by
+    several agents. Raw responses are cached, so tool calls still run on a hit.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, if any"""
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+    
+    def put(self, key: bytes, response: Dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _compile_template(template: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Parse a format template once
+
+    Returns the literal text before the first field and the names of the
+    inputs the template references. Malformed templates raise ValueError.
+    """
+    prefix = []
+    fields = set()
+    for literal_text, field_name, _, _ in string.Formatter().parse(template):
+        if not fields:
+            prefix.append(literal_text)
+        if field_name is not None:
+            # "user.name" and "items[0]" both read the "user"/"items" input
+            fields.add(re.split(r"[.\[]", field_name, maxsplit=1)[0])
+    return "".join(prefix), frozenset(fields)
+
+
+def _template_formatter(template: str, prefix: str, fields: FrozenSet[str]) -> Callable:
+    """Return the per-call formatter for a template parsed by _compile_template"""
+    if fields:
+        # format_map already assembles the chunks in C; a Python-level join of
+        # pre-split chunks measured slower, so it is used as is
+        return template.format_map
+    # Without fields the rendered prompt is the unescaped literal every time
+    return lambda inputs: prefix
+
+
+_TRANSIENT_ERROR_CODES = frozenset({"ThrottlingException", "ModelTimeoutException"})
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Check whether a Bedrock failure is worth retrying"""
+    while error is not None:
+        if isinstance(error, (ReadTimeoutError, ConnectTimeoutError)):
+            return True
+        if isinstance(error, ClientError):
+            return error.response.get("Error", {}).get("Code") in _TRANSIENT_ERROR_CODES
+        error = error.__cause__
+    return False
 
 
 class StrandsAgent(ABC):
@@ -48,51 +196,93 @@ class StrandsAgent(ABC):
     maintaining compatibility with Bedrock models.
     """
     
+    # Input keys checked before any prompt is built
+    REQUIRED_INPUTS: FrozenSet[str] = frozenset()
+    
+    _class_logger = logger.bind(agent_type="StrandsAgent")
+    
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._class_logger = logger.bind(agent_type=cls.__name__)
+    
+    @property
+    def logger(self):
+        """Logger bound to this agent's id, name and type"""
+        return self._class_logger.bind(**self._log_ctx)
+    
     def __init__(self, config: AgentConfig, bedrock_client: BedrockClient):
         self.config = config
         self.bedrock_client = bedrock_client
         self.agent_id = str(uuid.uuid4())
-        self.logger = logger.bind(
-            agent_id=self.agent_id,
-            agent_name=config.name,
-            agent_type=self.__class__.__name__
-        )
+        self._agent_short = self.agent_id[:8]
+        # Per-instance context is passed on each call; agent_type is bound per class
+        self._log_ctx = {"agent_id": self.agent_id, "agent_name": config.name}
         self.execution_count = 0
         self.success_count = 0
         self.failure_count = 0
         
+        # Tool definitions are serialized once; with prompt caching the last
+        # one carries the cache breakpoint for the whole list
+        self._tools_json = None
+        if config.tools:
+            tools = list(config.tools)
+            if config.prompt_caching:
+                tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
+            self._tools_json = json.dumps(tools)
+        
+        # Request shape shared by this agent's calls; the config is immutable
+        self._tools_key = (
+            config.model_type,
+            config.system_prompt,
+            config.temperature,
+            config.max_tokens,
+            self._tools_json
+        )
+        
+        self._cache_salt = repr(
+            (config.model_type.value, *self._tools_key[1:])
+        ).encode()
+        
+        # Static leading part of every prompt, cached by Claude models
+        self._prompt_prefix = ""
+        
+        # Per-request values in the system prompt would invalidate the cache
+        if config.system_prompt and any(
+            field_name is not None
+            for _, field_name, _, _ in string.Formatter().parse(config.system_prompt)
+        ):
+            self._class_logger.warning(
+                "System prompt contains placeholders; prompt caching requires it to be static",
+                **self._log_ctx
+            )
+        
         # CloudWatch logging
-        self.logger.info(
+        self._class_logger.info(
             "Agent initialized",
+            **self._log_ctx,
             model_type=config.model_type.value,
             temperature=config.temperature,
             max_tokens=config.max_tokens
         )
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
-        before_sleep=before_sleep_log(logger, "WARNING"),
-        after=after_log(logger, "INFO"),
-        reraise=True
-    )
     async def execute(self, inputs: Dict[str, Any]) -> Any:
         """
         Execute the agent with given inputs
         
         Implements Strands SDK execution pattern with:
-        - Automatic retry with exponential backoff
+        - Retry with exponential backoff on throttling and timeouts
         - CloudWatch logging
         - Fault tolerance
         - Execution tracking
         """
         self.execution_count += 1
-        execution_id = str(uuid.uuid4())
+        # Unique per agent without another urandom read; sortable within an agent
+        execution_id = f"{self._agent_short}-{self.execution_count:08x}"
         
         # CloudWatch structured logging
-        self.logger.info(
+        self._class_logger.info(
             "Agent execution started",
+            **self._log_ctx,
             execution_id=execution_id,
             execution_count=self.execution_count,
             inputs_keys=list(inputs.keys())
@@ -104,43 +294,55 @@ class StrandsAgent(ABC):
             
             # Prepare the prompt
             prompt = self._prepare_prompt(inputs)
+            if not prompt.strip():
+                raise ValueError("Prepared prompt is empty")
             
             # Apply reasoning pattern if configured
             if self.config.reasoning_pattern:
-                self.logger.debug(
-                    "Applying reasoning pattern",
-                    pattern=self.config.reasoning_pattern.__class__.__name__
-                )
+                if _DEBUG:
+                    self._class_logger.debug(
+                        "Applying reasoning pattern",
+                        **self._log_ctx,
+                        pattern=self.config.reasoning_pattern.__class__.__name__
+                    )
                 prompt = self.config.reasoning_pattern.apply(prompt, inputs)
             
-            # Execute with Bedrock (with built-in retry)
-            self.logger.debug(
-                "Invoking Bedrock model",
-                model=self.config.model_type.value,
-                prompt_length=len(prompt)
-            )
+            # Execute with Bedrock (retried on transient errors)
+            if _DEBUG:
+                self._class_logger.debug(
+                    "Invoking Bedrock model",
+                    **self._log_ctx,
+                    model=self.config.model_type.value,
+                    prompt_length=len(prompt)
+                )
             
-            response = await self.bedrock_client.invoke(
-                model_type=self.config.model_type,
-                prompt=prompt,
-                system_prompt=self.config.system_prompt,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                tools=self.config.tools if self.config.tools else None
-            )
+            cache = self.config.cache
+            response = None
+            if cache is not None:
+                cache_key = self._cache_key(prompt)
+                response = cache.get(cache_key)
+            cache_hit = response is not None
+            if not cache_hit:
+                response = await self._invoke_with_retry(prompt)
+                if cache is not None:
+                    cache.put(cache_key, response)
             
             # Process the response
             result = self._process_response(response, inputs)
+            if inspect.isawaitable(result):
+                result = await result
             
             # Track success
             self.success_count += 1
             
             # CloudWatch logging
-            self.logger.info(
+            self._class_logger.info(
                 "Agent execution completed successfully",
+                **self._log_ctx,
                 execution_id=execution_id,
                 model=self.config.model_type.value,
                 success_count=self.success_count,
+                cache_hit=cache_hit,
                 input_tokens=response.get("usage", {}).get("input_tokens", 0),
                 output_tokens=response.get("usage", {}).get("output_tokens", 0)
             )
@@ -152,8 +354,9 @@ class StrandsAgent(ABC):
             self.failure_count += 1
             
             # CloudWatch error logging
-            self.logger.error(
+            self._class_logger.error(
                 "Agent execution failed",
+                **self._log_ctx,
                 execution_id=execution_id,
                 error=str(e),
                 error_type=type(e).__name__,
@@ -165,16 +368,57 @@ class StrandsAgent(ABC):
                 f"Agent {self.config.name} execution failed: {str(e)}"
             ) from e
     
-    def _validate_inputs(self, inputs: Dict[str, Any]) -> None:
-        """Validate input data"""
-        if not isinstance(inputs, dict):
-            raise ValueError("Inputs must be a dictionary")
-        
-        # Log validation
-        self.logger.debug(
-            "Input validation passed",
-            input_count=len(inputs)
+    def _cache_key(self, prompt: str) -> bytes:
+        """Digest of the prompt and the request settings that shape the response"""
+        digest = hashlib.blake2b(self._cache_salt, digest_size=16)
+        digest.update(prompt.encode())
+        return digest.digest()
+    
+    async def _invoke_with_retry(self, prompt: str) -> Dict[str, Any]:
+        """
+        Invoke Bedrock, retrying only throttling and timeout failures
+
+        This is the only retry layer for agent calls: the client's own retry
+        is disabled so attempts do not multiply.
+        """
+        invoke_kwargs = dict(
+            model_type=self.config.model_type,
+            system_prompt=self.config.system_prompt,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            tools_json=self._tools_json,
+            cached_prefix=self._prompt_prefix if self.config.prompt_caching else None,
+            retry=False
         )
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.config.max_retries),
+            wait=wait_exponential(multiplier=self.config.retry_delay, min=2, max=10),
+            retry=retry_if_exception(_is_transient),
+            before_sleep=self._log_retry,
+            reraise=True
+        ):
+            with attempt:
+                return await self.bedrock_client.invoke(prompt=prompt, **invoke_kwargs)
+    
+    def _log_retry(self, retry_state) -> None:
+        """Log a retried Bedrock invocation"""
+        self._class_logger.warning(
+            "Retrying Bedrock invocation",
+            **self._log_ctx,
+            attempt=retry_state.attempt_number,
+            error=str(retry_state.outcome.exception())
+        )
+    
+    def _validate_inputs(self, inputs: Dict[str, Any]) -> None:
+        """Validate input data (the type check is compiled out under python -O)"""
+        assert isinstance(inputs, dict), "Inputs must be a dictionary"
+        self._check_required_inputs(inputs)
+    
+    def _check_required_inputs(self, inputs: Dict[str, Any]) -> None:
+        """Ensure every key in REQUIRED_INPUTS is present"""
+        missing = self.REQUIRED_INPUTS.difference(inputs)
+        if missing:
+            raise ValueError(f"Missing required inputs: {', '.join(sorted(missing))}")
     
     @abstractmethod
     def _prepare_prompt(self, inputs: Dict[str, Any]) -> str:
@@ -183,7 +427,7 @@ class StrandsAgent(ABC):
     
     @abstractmethod
     def _process_response(self, response: Dict[str, Any], inputs: Dict[str, Any]) -> Any:
-        """Process the model response"""
+        """Process the model response (may be a coroutine function)"""
         pass
     
     def get_metrics(self) -> Dict[str, Any]:
@@ -218,38 +462,50 @@ class SimpleAgent(StrandsAgent):
     ):
         super().__init__(config, bedrock_client)
         self.prompt_template = prompt_template
+        self._prompt_prefix, self._template_fields = _compile_template(prompt_template)
+        self.REQUIRED_INPUTS = self._template_fields
+        self._format = _template_formatter(
+            prompt_template, self._prompt_prefix, self._template_fields
+        )
         
-        self.logger.debug(
+        self._class_logger.debug(
             "SimpleAgent initialized",
+            **self._log_ctx,
             template_length=len(prompt_template)
         )
     
     def _prepare_prompt(self, inputs: Dict[str, Any]) -> str:
         """Prepare prompt using template"""
         try:
-            prompt = self.prompt_template.format(**inputs)
-            self.logger.debug(
-                "Prompt prepared",
-                prompt_length=len(prompt)
-            )
+            prompt = self._format(inputs)
+            if _DEBUG:
+                self._class_logger.debug(
+                    "Prompt prepared",
+                    **self._log_ctx,
+                    prompt_length=len(prompt)
+                )
             return prompt
         except KeyError as e:
-            self.logger.error(
+            self._class_logger.error(
                 "Missing required input for prompt template",
+                **self._log_ctx,
                 missing_key=str(e),
+                required_keys=sorted(self._template_fields),
                 available_keys=list(inputs.keys())
             )
             raise ValueError(f"Missing required input: {e}")
     
     def _process_response(self, response: Dict[str, Any], inputs: Dict[str, Any]) -> Any:
         """Extract text from response"""
-        content = response.get("content", [{}])
-        if content and len(content) > 0:
+        content = response.get("content")
+        if content:
             text = content[0].get("text", "")
-            self.logger.debug(
-                "Response processed",
-                response_length=len(text)
-            )
+            if _DEBUG:
+                self._class_logger.debug(
+                    "Response processed",
+                    **self._log_ctx,
+                    response_length=len(text)
+                )
             return text
         return ""
 
@@ -271,10 +527,21 @@ class ToolAgent(StrandsAgent):
     ):
         super().__init__(config, bedrock_client)
         self.prompt_template = prompt_template
+        self._prompt_prefix, self._template_fields = _compile_template(prompt_template)
+        self.REQUIRED_INPUTS = self._template_fields
+        self._format = _template_formatter(
+            prompt_template, self._prompt_prefix, self._template_fields
+        )
         self.tool_handlers = tool_handlers
+        # Caps concurrent tool calls; one per event loop, because asyncio
+        # semaphores bind to a loop and agents run under several asyncio.run
+        self._tool_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
         
-        self.logger.info(
+        self._class_logger.info(
             "ToolAgent initialized",
+            **self._log_ctx,
             tool_count=len(tool_handlers),
             tools=list(tool_handlers.keys())
         )
@@ -282,69 +549,101 @@ class ToolAgent(StrandsAgent):
     def _prepare_prompt(self, inputs: Dict[str, Any]) -> str:
         """Prepare prompt with tool context"""
         try:
-            return self.prompt_template.format(**inputs)
+            return self._format(inputs)
         except KeyError as e:
             raise ValueError(f"Missing required input: {e}")
     
-    def _process_response(self, response: Dict[str, Any], inputs: Dict[str, Any]) -> Any:
-        """Process response and handle tool calls"""
-        content = response.get("content", [])
+    async def _process_response(self, response: Dict[str, Any], inputs: Dict[str, Any]) -> Any:
+        """Process response and run the requested tool calls concurrently"""
+        content = response.get("content") or ()
+        handlers = self.tool_handlers
         
         results = []
-        tool_calls = 0
+        results_append = results.append
+        tool_calls = []
         
         for item in content:
-            if item.get("type") == "text":
-                results.append(item.get("text", ""))
-            elif item.get("type") == "tool_use":
-                tool_name = item.get("name")
-                tool_input = item.get("input", {})
+            item_get = item.get
+            item_type = item_get("type")
+            if item_type == "text":
+                results_append(item_get("text", ""))
+            elif item_type == "tool_use":
+                tool_name = item_get("name")
+                tool_input = item_get("input", {})
                 
-                self.logger.info(
+                self._class_logger.info(
                     "Tool invocation",
+                    **self._log_ctx,
                     tool_name=tool_name,
                     tool_input_keys=list(tool_input.keys())
                 )
                 
-                if tool_name in self.tool_handlers:
-                    try:
-                        tool_result = self.tool_handlers[tool_name](tool_input)
-                        tool_calls += 1
-                        
-                        self.logger.info(
-                            "Tool execution successful",
-                            tool_name=tool_name
-                        )
-                        
-                        results.append({
-                            "tool": tool_name,
-                            "result": tool_result
-                        })
-                    except Exception as e:
-                        self.logger.error(
-                            "Tool execution failed",
-                            tool_name=tool_name,
-                            error=str(e),
-                            exc_info=True
-                        )
-                        results.append({
-                            "tool": tool_name,
-                            "error": str(e)
-                        })
+                handler = handlers.get(tool_name)
+                if handler is not None:
+                    # Reserve the slot so results keep the response order
+                    tool_calls.append((len(results), tool_name, handler, tool_input))
+                    results_append(None)
                 else:
-                    self.logger.warning(
+                    self._class_logger.warning(
                         "Tool handler not found",
+                        **self._log_ctx,
                         tool_name=tool_name,
-                        available_tools=list(self.tool_handlers.keys())
+                        available_tools=list(handlers.keys())
                     )
         
-        self.logger.debug(
-            "Response processing complete",
-            result_count=len(results),
-            tool_calls=tool_calls
-        )
+        if tool_calls:
+            outcomes = await asyncio.gather(
+                *(self._run_tool(handler, tool_input) for _, _, handler, tool_input in tool_calls),
+                return_exceptions=True
+            )
+            for (index, tool_name, _, _), outcome in zip(tool_calls, outcomes):
+                if isinstance(outcome, Exception):
+                    self._class_logger.error(
+                        "Tool execution failed",
+                        **self._log_ctx,
+                        tool_name=tool_name,
+                        error=str(outcome),
+                        exc_info=outcome
+                    )
+                    results[index] = {
+                        "tool": tool_name,
+                        "error": str(outcome)
+                    }
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    self._class_logger.info(
+                        "Tool execution successful",
+                        **self._log_ctx,
+                        tool_name=tool_name
+                    )
+                    results[index] = {
+                        "tool": tool_name,
+                        "result": outcome
+                    }
+        
+        if _DEBUG:
+            self._class_logger.debug(
+                "Response processing complete",
+                **self._log_ctx,
+                result_count=len(results),
+                tool_calls=len(tool_calls)
+            )
         
         return results if len(results) > 1 else results[0] if results else ""
+    
+    async def _run_tool(self, handler: Callable, tool_input: Dict[str, Any]) -> Any:
+        """Run one tool handler, moving synchronous handlers off the event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._tool_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._tool_semaphores[loop] = asyncio.Semaphore(
+                self.config.max_parallel_tools
+            )
+        async with semaphore:
+            if inspect.iscoroutinefunction(handler):
+                return await handler(tool_input)
+            return await asyncio.to_thread(handler, tool_input)
 
 
 class ReasoningAgent(StrandsAgent):
@@ -355,17 +654,20 @@ class ReasoningAgent(StrandsAgent):
     Implements Strands SDK reasoning patterns.
     """
     
+    REQUIRED_INPUTS = frozenset({"task"})
+    
     def __init__(
         self,
         config: AgentConfig,
         bedrock_client: BedrockClient,
         reasoning_pattern: ReasoningPattern
     ):
-        config.reasoning_pattern = reasoning_pattern
+        config = replace(config, reasoning_pattern=reasoning_pattern)
         super().__init__(config, bedrock_client)
         
-        self.logger.info(
+        self._class_logger.info(
             "ReasoningAgent initialized",
+            **self._log_ctx,
             reasoning_pattern=reasoning_pattern.__class__.__name__
         )
     
@@ -376,34 +678,39 @@ class ReasoningAgent(StrandsAgent):
         
         prompt = f"Task: {task}\n\nContext: {context}"
         
-        self.logger.debug(
-            "Reasoning prompt prepared",
-            task_length=len(task),
-            context_length=len(context)
-        )
+        if _DEBUG:
+            self._class_logger.debug(
+                "Reasoning prompt prepared",
+                **self._log_ctx,
+                task_length=len(task),
+                context_length=len(context)
+            )
         
         return prompt
     
     def _process_response(self, response: Dict[str, Any], inputs: Dict[str, Any]) -> Any:
         """Extract reasoning and final answer"""
-        text = response.get("content", [{}])[0].get("text", "")
+        content = response.get("content")
+        text = content[0].get("text", "") if content else ""
         
         # Parse reasoning steps and final answer
-        lines = text.split("\n")
         reasoning_steps = []
         final_answer = ""
         
-        for line in lines:
-            if line.startswith("Step") or line.startswith("Thought"):
-                reasoning_steps.append(line)
-            elif line.startswith("Answer:") or line.startswith("Final Answer:"):
-                final_answer = line.split(":", 1)[1].strip()
+        for match in _REASONING_RE.finditer(text):
+            step, answer = match.groups()
+            if step is not None:
+                reasoning_steps.append(step)
+            else:
+                final_answer = answer.strip()
         
-        self.logger.debug(
-            "Reasoning extracted",
-            reasoning_steps_count=len(reasoning_steps),
-            has_final_answer=bool(final_answer)
-        )
+        if _DEBUG:
+            self._class_logger.debug(
+                "Reasoning extracted",
+                **self._log_ctx,
+                reasoning_steps_count=len(reasoning_steps),
+                has_final_answer=bool(final_answer)
+            )
         
         return {
             "reasoning": reasoning_steps,
@@ -3,18 +3,51 @@ Core workflow engine for AgentFlow
 """
 
 import asyncio
+import hashlib
+import json
+import logging
+import random
+import sys
 import uuid
-from typing import Any, Dict, List, Optional, Callable
+import time
+import structlog
+from typing import Any, Dict, List, Tuple, MutableMapping, Optional
 from dataclasses import dataclass, field
 from enum import Enum
-import structlog
-
+from datetime import datetime, timezone
 from agentflow.core.agent import Agent
 from agentflow.utils.logging import setup_logger
 from agentflow.utils.exceptions import WorkflowError, AgentExecutionError
 
+# Try to import orjson for faster cache-key serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = setup_logger(__name__)
 
+# Checked once so disabled debug logs cost a global lookup on the step path
+_DEBUG = logger.is_enabled_for(logging.DEBUG)
+
+# asyncio.timeout (3.11+) runs the step in the current task; wait_for wraps
+# it in a new one
+_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+
+def _step_cache_key(agent_name: str, inputs: Dict[str, Any]) -> str:
+    """Hash an agent name and canonical JSON of its inputs"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(
+            inputs,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    else:
+        payload = json.dumps(inputs, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload + agent_name.encode(), digest_size=16).hexdigest()
+
 
 class WorkflowStatus(Enum):
     """Workflow execution status"""
@@ -25,19 +58,26 @@ class WorkflowStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowConfig:
     """Configuration for workflow execution"""
     name: str
     description: str = ""
     max_retries: int = 3
-    timeout_seconds: int = 300
+    max_backoff_seconds: float = 30.0
+    # Per-attempt step timeout; None lets steps run until they finish
+    timeout_seconds: Optional[float] = None
     enable_parallel: bool = True
+    max_concurrency: int = 32
     log_level: str = "INFO"
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Track step counts, retries and timings in Workflow.execution_metrics
+    enable_metrics: bool = True
+    # Results of cacheable steps, e.g. a dict or diskcache.Cache
+    cache: Optional[MutableMapping[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     """Individual step in workflow"""
     step_id: str
@@ -48,14 +88,32 @@ class WorkflowStep:
     status: WorkflowStatus = WorkflowStatus.PENDING
     result: Optional[Any] = None
     error: Optional[str] = None
+    cacheable: bool = False
+    # (dependency, input key) pairs, filled in by add_step
+    _dep_keys: List[Tuple[str, str]] = field(default_factory=list, init=False, repr=False)
+    # Snapshot of agent.config.name, taken by add_step
+    agent_name: str = field(default="", init=False)
+
+
+@dataclass(slots=True)
+class CompiledPlan:
+    """Validated step graph, reused across executions of the same workflow"""
+    batches: List[List[str]]
+    # Unfinished-dependency count per step; copy before decrementing
+    pending: Dict[str, int]
+    children: Dict[str, List[str]]
 
 
 class Workflow:
     """
     Main workflow orchestration engine
     
-    Manages execution of multi-step agent workflows with dependency resolution,
-    parallel execution, error handling, and observability.
+    Manages execution of multi-step agent workflows with:
+    - Dependency resolution
+    - Parallel execution
+    - Fault tolerance with automatic retry
+    - CloudWatch logging
+    - Execution tracking and observability
     """
     
     def __init__(self, config: WorkflowConfig):
@@ -65,223 +123,501 @@ class Workflow:
         self.status = WorkflowStatus.PENDING
         self.logger = logger.bind(workflow_id=self.workflow_id, workflow_name=config.name)
         self.execution_history: List[Dict[str, Any]] = []
+        self._compiled: Optional[CompiledPlan] = None
+        self._log_queue: Optional[asyncio.Queue] = None
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.execution_metrics: Dict[str, Any] = self._new_metrics()
+        # Created per run in execute, because the event loop may differ
+        self._sem: Optional[asyncio.Semaphore] = None
+        
+        # CloudWatch logging
+        self.logger.info(
+            "Workflow initialized",
+            max_retries=config.max_retries,
+            timeout_seconds=config.timeout_seconds,
+            enable_parallel=config.enable_parallel
+        )
         
     def add_step(
         self,
         step_id: str,
         agent: Agent,
         inputs: Dict[str, Any],
-        dependencies: Optional[List[str]] = None
+        dependencies: Optional[List[str]] = None,
+        cacheable: bool = False
     ) -> "Workflow":
-        """Add a step to the workflow"""
+        """
+        Add a step to the workflow
+        
+        Steps marked cacheable must be pure: with config.cache set, their
+        result is reused for identical agent name and inputs.
+        """
         if step_id in self.steps:
             raise WorkflowError(f"Step {step_id} already exists")
-            
+        
+        # Interned so the scheduler's dict lookups can match on identity
+        step_id = sys.intern(step_id)
         step = WorkflowStep(
             step_id=step_id,
             agent=agent,
             inputs=inputs,
-            dependencies=dependencies or []
+            dependencies=[sys.intern(dep) for dep in dependencies or ()],
+            cacheable=cacheable
         )
+        step.agent_name = agent.config.name
+        step._dep_keys = [
+            (dep, sys.intern(f"{dep}_result")) for dep in step.dependencies
+        ]
         
         self.steps[step_id] = step
-        self.logger.info(f"Added step {step_id}", agent=agent.config.name)
+        self._compiled = None
+        self.logger.info("Added step", step_id=step_id, agent=step.agent_name)
         return self
     
+    @staticmethod
+    def _new_metrics() -> Dict[str, Any]:
+        """Zeroed execution counters for a run"""
+        return {
+            "total_steps": 0,
+            "completed_steps": 0,
+            "failed_steps": 0,
+            "retried_steps": 0,
+            "cache_hits": 0
+        }
+    
     async def execute(self) -> Dict[str, Any]:
-        """Execute the workflow"""
-        self.logger.info("Starting workflow execution")
+        """
+        Execute the workflow
+        
+        Implements:
+        - Per-step retry (see _execute_step)
+        - CloudWatch logging
+        - Execution metrics
+        - Fault tolerance
+        """
+        self.start_time = time.time()
         self.status = WorkflowStatus.RUNNING
         
+        # Counters and history describe a single run; fresh objects keep the
+        # result of an earlier run intact
+        self.execution_metrics = self._new_metrics()
+        self.execution_history = []
+        
+        # Tasks created below copy this context, so step, agent and client
+        # logs during the run all carry the workflow IDs
+        context_tokens = structlog.contextvars.bind_contextvars(
+            workflow_id=self.workflow_id,
+            workflow_name=self.config.name
+        )
+        
+        # Log records are rendered by a background task, off the step path
+        self._log_queue = asyncio.Queue()
+        log_task = asyncio.create_task(self._log_worker(self._log_queue))
+        
+        # CloudWatch logging
+        self._emit(
+            "Workflow execution started",
+            step_count=len(self.steps)
+        )
+        
         try:
-            # Validate workflow
-            self._validate_workflow()
+            # Validate workflow (once, until add_step changes the graph)
+            execution_order = self.compile().batches
             
-            # Execute steps in dependency order
-            execution_order = self._resolve_dependencies()
-            results = {}
+            # Created here because the event loop may not exist at __init__
+            self._sem = asyncio.Semaphore(self.config.max_concurrency)
             
-            for batch in execution_order:
-                if self.config.enable_parallel and len(batch) > 1:
-                    batch_results = await self._execute_parallel(batch, results)
-                else:
-                    batch_results = await self._execute_sequential(batch, results)
-                
-                results.update(batch_results)
+            self._emit(
+                "Execution order resolved",
+                batch_count=len(execution_order),
+                execution_order=[batch for batch in execution_order]
+            )
+            
+            results = await self._run_scheduler()
             
+            self.end_time = time.time()
             self.status = WorkflowStatus.COMPLETED
-            self.logger.info("Workflow completed successfully")
+            
+            # Update metrics
+            if self.config.enable_metrics:
+                self.execution_metrics["total_steps"] = len(self.steps)
+                self.execution_metrics["completed_steps"] = len(results)
+                self.execution_metrics["execution_time"] = self.end_time - self.start_time
+            
+            # CloudWatch logging
+            self._emit(
+                "Workflow completed successfully",
+                execution_time=self.end_time - self.start_time,
+                total_steps=len(self.steps),
+                completed_steps=len(results),
+                metrics=self.execution_metrics
+            )
             
             return {
                 "workflow_id": self.workflow_id,
                 "status": self.status.value,
                 "results": results,
-                "execution_history": self.execution_history
+                "execution_history": self.execution_history,
+                "metrics": self.execution_metrics,
+                "execution_time": self.end_time - self.start_time
             }
             
         except Exception as e:
+            self.end_time = time.time()
             self.status = WorkflowStatus.FAILED
-            self.logger.error(f"Workflow failed: {str(e)}", exc_info=True)
+            
+            # Update metrics
+            if self.config.enable_metrics:
+                self.execution_metrics["execution_time"] = self.end_time - self.start_time if self.start_time else 0
+            
+            # CloudWatch error logging
+            logger.error(
+                "Workflow execution failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                execution_time=self.end_time - self.start_time if self.start_time else 0,
+                metrics=self.execution_metrics,
+                exc_info=True
+            )
+            
             raise WorkflowError(f"Workflow execution failed: {str(e)}") from e
+        
+        finally:
+            await self._log_queue.join()
+            log_task.cancel()
+            self._log_queue = None
+            structlog.contextvars.reset_contextvars(**context_tokens)
+    
+    def _emit(self, event: str, **fields: Any) -> None:
+        """
+        Queue an info record for the log worker, or log it directly outside execute
+        
+        Inside execute, workflow IDs come from the bound context variables,
+        so records go through the module logger rather than self.logger.
+        """
+        if self._log_queue is None:
+            self.logger.info(event, **fields)
+        else:
+            self._log_queue.put_nowait((event, fields))
+    
+    async def _log_worker(self, queue: asyncio.Queue) -> None:
+        """Drain queued log records until cancelled"""
+        while True:
+            event, fields = await queue.get()
+            try:
+                logger.info(event, **fields)
+            except Exception:
+                pass  # A broken handler must not stall queue.join()
+            finally:
+                queue.task_done()
+    
+    def compile(self) -> CompiledPlan:
+        """
+        Validate and order the steps, reusing the plan from earlier calls
+        
+        The plan is dropped by add_step; mutate step dependencies only
+        through add_step.
+        """
+        if self._compiled is None:
+            self._validate_workflow()
+        return self._compiled
     
     def _validate_workflow(self) -> None:
         """Validate workflow configuration"""
         if not self.steps:
             raise WorkflowError("Workflow has no steps")
         
-        # Check for circular dependencies
-        for step_id, step in self.steps.items():
-            visited = set()
-            if self._has_circular_dependency(step_id, visited):
-                raise WorkflowError(f"Circular dependency detected for step {step_id}")
-        
         # Validate all dependencies exist
         for step_id, step in self.steps.items():
             for dep in step.dependencies:
                 if dep not in self.steps:
                     raise WorkflowError(f"Step {step_id} depends on non-existent step {dep}")
-    
-    def _has_circular_dependency(self, step_id: str, visited: set) -> bool:
-        """Check for circular dependencies"""
-        if step_id in visited:
-            return True
-        
-        visited.add(step_id)
-        step = self.steps[step_id]
-        
-        for dep in step.dependencies:
-            if self._has_circular_dependency(dep, visited.copy()):
-                return True
         
-        return False
+        # Ordering the steps also detects circular dependencies
+        self._compiled = self._compile_plan()
     
     def _resolve_dependencies(self) -> List[List[str]]:
         """Resolve execution order based on dependencies"""
+        return self._compile_plan().batches
+    
+    def _compile_plan(self) -> CompiledPlan:
+        """
+        Order the steps into batches and record the graph for the scheduler
+        
+        Kahn's algorithm, one layer per batch: each step and dependency edge
+        is visited once. Steps left over when no layer is ready form a cycle.
+        """
+        pending = {step_id: len(step.dependencies) for step_id, step in self.steps.items()}
+        indegree = dict(pending)
+        children: Dict[str, List[str]] = {step_id: [] for step_id in self.steps}
+        for step_id, step in self.steps.items():
+            for dep in step.dependencies:
+                children[dep].append(step_id)
+        
         execution_order = []
-        completed = set()
-        
-        while len(completed) < len(self.steps):
-            # Find steps that can be executed
-            ready = []
-            for step_id, step in self.steps.items():
-                if step_id not in completed:
-                    if all(dep in completed for dep in step.dependencies):
-                        ready.append(step_id)
-            
-            if not ready:
-                raise WorkflowError("Cannot resolve dependencies - possible circular dependency")
-            
+        processed = 0
+        ready = [step_id for step_id, count in indegree.items() if count == 0]
+        
+        while ready:
             execution_order.append(ready)
-            completed.update(ready)
+            processed += len(ready)
+            next_ready = []
+            for step_id in ready:
+                for child in children[step_id]:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        next_ready.append(child)
+            ready = next_ready
         
-        return execution_order
+        if processed < len(self.steps):
+            blocked = [step_id for step_id, count in indegree.items() if count > 0]
+            raise WorkflowError(
+                f"Circular dependency detected among steps: {', '.join(blocked)}"
+            )
+        
+        return CompiledPlan(batches=execution_order, pending=pending, children=children)
     
-    async def _execute_parallel(
-        self,
-        step_ids: List[str],
-        previous_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Execute steps in parallel"""
-        self.logger.info(f"Executing {len(step_ids)} steps in parallel", steps=step_ids)
+    async def _run_scheduler(self) -> Dict[str, Any]:
+        """
+        Run every step as soon as all of its dependencies have completed
         
-        tasks = []
-        for step_id in step_ids:
-            task = self._execute_step(step_id, previous_results)
-            tasks.append(task)
+        Each step keeps a count of unfinished dependencies; when a step
+        finishes, its dependents' counts drop and any that reach zero start
+        immediately rather than waiting for the rest of their batch. The
+        first failure cancels the steps still running.
+        """
+        results: Dict[str, Any] = {}
+        plan = self._compiled
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if not self.config.enable_parallel:
+            for batch in plan.batches:
+                for step_id in batch:
+                    results[step_id] = await self._execute_step(step_id, results)
+            return results
         
-        batch_results = {}
-        for step_id, result in zip(step_ids, results):
-            if isinstance(result, Exception):
-                raise AgentExecutionError(f"Step {step_id} failed: {str(result)}")
-            batch_results[step_id] = result
+        pending = dict(plan.pending)
+        children = plan.children
         
-        return batch_results
+        running: Dict[asyncio.Task, str] = {}
+        
+        def start(step_id: str) -> None:
+            task = asyncio.create_task(self._gated_execute_step(step_id, results))
+            running[task] = step_id
+        
+        for step_id in plan.batches[0]:
+            start(step_id)
+        
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_id = running.pop(task)
+                    results[step_id] = task.result()
+                    for child in children[step_id]:
+                        pending[child] -= 1
+                        if pending[child] == 0:
+                            start(child)
+        except BaseException:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+        
+        # Report results in execution order rather than completion order
+        return {step_id: results[step_id] for batch in plan.batches for step_id in batch}
     
-    async def _execute_sequential(
+    async def _gated_execute_step(
         self,
-        step_ids: List[str],
+        step_id: str,
         previous_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Execute steps sequentially"""
-        self.logger.info(f"Executing {len(step_ids)} steps sequentially", steps=step_ids)
-        
-        results = {}
-        for step_id in step_ids:
-            result = await self._execute_step(step_id, previous_results)
-            results[step_id] = result
-            previous_results[step_id] = result
-        
-        return results
+    ) -> Any:
+        """Execute a step once a concurrency slot is free"""
+        async with self._sem:
+            return await self._execute_step(step_id, previous_results)
+    
+    def _backoff(self, retry_count: int) -> float:
+        """Jittered exponential backoff so concurrent steps don't retry in lockstep"""
+        return min(
+            self.config.max_backoff_seconds,
+            (2 ** retry_count) * random.uniform(0.5, 1.5)
+        )
     
     async def _execute_step(
         self,
         step_id: str,
         previous_results: Dict[str, Any]
     ) -> Any:
-        """Execute a single step with retry logic"""
+        """
+        Execute a single step with fault tolerance
+        
+        Implements:
+        - Automatic retry with jittered exponential backoff
+        - CloudWatch logging
+        - Timeout handling
+        - Execution tracking
+        """
         step = self.steps[step_id]
         step.status = WorkflowStatus.RUNNING
+        step_start_ns = time.monotonic_ns()
         
         # Merge inputs with previous results
-        inputs = step.inputs.copy()
-        for dep in step.dependencies:
-            if dep in previous_results:
-                inputs[f"{dep}_result"] = previous_results[dep]
+        inputs = step.inputs | {
+            key: previous_results[dep]
+            for dep, key in step._dep_keys
+            if dep in previous_results
+        }
+        
+        # CloudWatch logging
+        self._emit(
+            "Step execution started",
+            step_id=step_id,
+            agent=step.agent_name,
+            dependencies=step.dependencies,
+            input_keys=list(inputs.keys())
+        )
+        
+        cache = self.config.cache if step.cacheable else None
+        if cache is not None:
+            cache_key = _step_cache_key(step.agent_name, inputs)
+            if cache_key in cache:
+                result = cache[cache_key]
+                step.status = WorkflowStatus.COMPLETED
+                step.result = result
+                if self.config.enable_metrics:
+                    self.execution_metrics["completed_steps"] += 1
+                    self.execution_metrics["cache_hits"] += 1
+                
+                self.execution_history.append({
+                    "step_id": step_id,
+                    "status": "cached",
+                    "attempt": 0,
+                    "execution_time": (time.monotonic_ns() - step_start_ns) / 1e9,
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                })
+                
+                self._emit("Step result served from cache", step_id=step_id)
+                return result
         
         retry_count = 0
         last_error = None
         
         while retry_count <= self.config.max_retries:
             try:
-                self.logger.info(
-                    f"Executing step {step_id}",
-                    attempt=retry_count + 1,
-                    agent=step.agent.config.name
-                )
+                if _DEBUG:
+                    logger.debug(
+                        "Executing step",
+                        step_id=step_id,
+                        attempt=retry_count + 1,
+                        max_retries=self.config.max_retries,
+                        agent=step.agent_name
+                    )
                 
-                result = await step.agent.execute(inputs)
+                # Execute with timeout
+                if _ASYNCIO_TIMEOUT:
+                    async with asyncio.timeout(self.config.timeout_seconds):
+                        result = await step.agent.execute(inputs)
+                else:
+                    result = await asyncio.wait_for(
+                        step.agent.execute(inputs),
+                        timeout=self.config.timeout_seconds
+                    )
                 
+                execution_time = (time.monotonic_ns() - step_start_ns) / 1e9
                 step.status = WorkflowStatus.COMPLETED
                 step.result = result
+                if cache is not None:
+                    cache[cache_key] = result
+                
+                # Update metrics
+                if self.config.enable_metrics:
+                    self.execution_metrics["completed_steps"] += 1
+                    if retry_count > 0:
+                        self.execution_metrics["retried_steps"] += 1
                 
+                # CloudWatch logging
                 self.execution_history.append({
                     "step_id": step_id,
                     "status": "success",
                     "attempt": retry_count + 1,
-                    "result": result
+                    "result": result,
+                    "execution_time": execution_time,
+                    "timestamp": datetime.now(timezone.utc).isoformat()
                 })
                 
-                self.logger.info(f"Step {step_id} completed successfully")
+                self._emit(
+                    "Step completed successfully",
+                    step_id=step_id,
+                    execution_time=execution_time,
+                    attempts=retry_count + 1
+                )
+                
                 return result
                 
+            except asyncio.TimeoutError as e:
+                last_error = e
+                retry_count += 1
+                step.retry_count = retry_count
+                
+                logger.warning(
+                    "Step timed out",
+                    step_id=step_id,
+                    attempt=retry_count,
+                    timeout=self.config.timeout_seconds
+                )
+                
+                if retry_count <= self.config.max_retries:
+                    await asyncio.sleep(self._backoff(retry_count))
+                    
             except Exception as e:
                 last_error = e
                 retry_count += 1
                 step.retry_count = retry_count
                 
-                self.logger.warning(
-                    f"Step {step_id} failed",
+                logger.warning(
+                    "Step failed",
+                    step_id=step_id,
                     attempt=retry_count,
                     error=str(e),
+                    error_type=type(e).__name__,
                     exc_info=True
                 )
                 
                 if retry_count <= self.config.max_retries:
-                    await asyncio.sleep(2 ** retry_count)  # Exponential backoff
+                    await asyncio.sleep(self._backoff(retry_count))
         
         # All retries exhausted
+        execution_time = (time.monotonic_ns() - step_start_ns) / 1e9
         step.status = WorkflowStatus.FAILED
         step.error = str(last_error)
         
+        # Update metrics
+        if self.config.enable_metrics:
+            self.execution_metrics["failed_steps"] += 1
+        
+        # CloudWatch error logging
         self.execution_history.append({
             "step_id": step_id,
             "status": "failed",
             "attempts": retry_count,
-            "error": str(last_error)
+            "error": str(last_error),
+            "error_type": type(last_error).__name__,
+            "execution_time": execution_time,
+            "timestamp": datetime.now(timezone.utc).isoformat()
         })
         
+        logger.error(
+            "Step failed after all retries",
+            step_id=step_id,
+            attempts=retry_count,
+            error=str(last_error),
+            execution_time=execution_time
+        )
+        
         raise AgentExecutionError(
             f"Step {step_id} failed after {retry_count} attempts: {str(last_error)}"
         )
+
+
+# Backward compatibility alias for the former agentflow.core.workflow_strands engine
+StrandsWorkflow = Workflow
@@ -4,14 +4,29 @@ MCP Configuration Management
 Handles loading and parsing MCP server configurations.
 """
 
+import copy
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional
 from agentflow.utils.logging import setup_logger
 
+# Try to import orjson for faster serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = setup_logger(__name__)
 
+# Config file location relative to a workspace, and the user-level file
+# (resolved once; Path.home() consults the environment on every call)
+_MCP_CONFIG_RELPATH = Path(".kiro", "settings", "mcp.json")
+_USER_MCP_CONFIG_PATH = Path.home() / _MCP_CONFIG_RELPATH
+
 
 class MCPConfig:
     """
@@ -37,32 +52,47 @@ class MCPConfig:
         """
         self.workspace_dir = workspace_dir or os.getcwd()
         self.config_path = config_path
-        self.servers: Dict[str, Dict[str, Any]] = {}
+        self._servers: Dict[str, Dict[str, Any]] = {}
+        # autoApprove lists as sets, built once the configs are merged
+        self._auto_approve: Dict[str, FrozenSet[str]] = {}
+        self._auto_approve_all: FrozenSet[str] = frozenset()
         
-        self._load_configurations()
+        # Config files are read on first access, not at construction
+        self._loaded = False
+        self._load_lock = threading.Lock()
+    
+    @property
+    def servers(self) -> Dict[str, Dict[str, Any]]:
+        """Server configurations, loaded on first access"""
+        self._ensure_loaded()
+        return self._servers
+    
+    def _ensure_loaded(self) -> None:
+        """Load configurations once, even with concurrent first callers"""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load_configurations()
+                self._loaded = True
     
     def _load_configurations(self) -> None:
         """Load MCP configurations from multiple sources"""
         configs = []
         
-        # 1. Load user-level config
-        user_config_path = Path.home() / ".kiro" / "settings" / "mcp.json"
-        if user_config_path.exists():
-            configs.append(self._load_config_file(user_config_path))
-            logger.info(f"Loaded user-level MCP config: {user_config_path}")
-        
-        # 2. Load workspace-level config
-        workspace_config_path = Path(self.workspace_dir) / ".kiro" / "settings" / "mcp.json"
-        if workspace_config_path.exists():
-            configs.append(self._load_config_file(workspace_config_path))
-            logger.info(f"Loaded workspace-level MCP config: {workspace_config_path}")
-        
-        # 3. Load custom config if specified
+        # 1. User-level, 2. workspace-level, 3. custom config if specified
+        candidates = [
+            ("user-level", _USER_MCP_CONFIG_PATH),
+            ("workspace-level", Path(self.workspace_dir, _MCP_CONFIG_RELPATH)),
+        ]
         if self.config_path:
-            custom_path = Path(self.config_path)
-            if custom_path.exists():
-                configs.append(self._load_config_file(custom_path))
-                logger.info(f"Loaded custom MCP config: {custom_path}")
+            candidates.append(("custom", Path(self.config_path)))
+        
+        for label, path in candidates:
+            config = self._load_config_file(path)
+            if config is not None:
+                configs.append(config)
+                logger.info(f"Loaded {label} MCP config: {path}")
         
         # 4. Load from environment variable
         env_config = os.environ.get("AGENTFLOW_MCP_CONFIG")
@@ -76,11 +106,23 @@ class MCPConfig:
         # Merge configurations (workspace takes precedence)
         self._merge_configs(configs)
     
-    def _load_config_file(self, path: Path) -> Dict[str, Any]:
-        """Load configuration from JSON file"""
+    def _load_config_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load configuration from JSON file
+        
+        Returns None if the file does not exist. Opening directly instead of
+        checking exists() first saves a stat per candidate path.
+        """
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to load config from {path}: {e}")
+            return {}
+        
+        try:
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
         except Exception as e:
             logger.error(f"Failed to load config from {path}: {e}")
             return {}
@@ -89,44 +131,81 @@ class MCPConfig:
         """
         Merge multiple configurations
         
-        Later configs override earlier ones for same server names.
+        Later configs override earlier ones key by key for same server names:
+        nested dicts such as env are merged, so a later level only needs to
+        declare what it changes. Lists, autoApprove included, are replaced,
+        so a later level can narrow them. Servers whose merged config is
+        disabled are dropped, and a later "disabled": false re-enables one.
         """
         for config in configs:
             mcp_servers = config.get("mcpServers", {})
             for server_name, server_config in mcp_servers.items():
-                # Skip disabled servers
-                if server_config.get("disabled", False):
-                    logger.info(f"Skipping disabled MCP server: {server_name}")
-                    continue
-                
-                self.servers[server_name] = server_config
+                self._deep_merge(self._servers.setdefault(server_name, {}), server_config)
+        
+        for server_name in list(self._servers):
+            if self._servers[server_name].get("disabled", False):
+                logger.info(f"Skipping disabled MCP server: {server_name}")
+                del self._servers[server_name]
+            else:
                 logger.debug(f"Registered MCP server: {server_name}")
+        
+        self._auto_approve = {
+            server_name: frozenset(server_config.get("autoApprove", ()))
+            for server_name, server_config in self._servers.items()
+        }
+        # Servers whose autoApprove list contains "*"
+        self._auto_approve_all = frozenset(
+            server_name
+            for server_name, auto_approve in self._auto_approve.items()
+            if "*" in auto_approve
+        )
+    
+    @classmethod
+    def _deep_merge(cls, dst: Dict[str, Any], src: Mapping[str, Any]) -> None:
+        """Merge src into dst in place"""
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(value, Mapping) and isinstance(current, dict):
+                cls._deep_merge(current, value)
+            else:
+                dst[key] = value
+    
+    def get_server_config(self, server_name: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a read-only view of the configuration for a specific server
+        
+        The view is shallow: nested args/env values are the stored objects
+        and must not be modified; use copy_server_config for a mutable copy.
+        """
+        server_config = self.servers.get(server_name)
+        if server_config is None:
+            return None
+        return MappingProxyType(server_config)
     
-    def get_server_config(self, server_name: str) -> Optional[Dict[str, Any]]:
-        """Get configuration for a specific server"""
-        return self.servers.get(server_name)
+    def get_all_servers(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of all server configurations (shallow, as above)"""
+        return MappingProxyType(self.servers)
     
-    def get_all_servers(self) -> Dict[str, Dict[str, Any]]:
-        """Get all server configurations"""
-        return self.servers
+    def copy_server_config(self, server_name: str) -> Optional[Dict[str, Any]]:
+        """Get a mutable deep copy of the configuration for a specific server"""
+        server_config = self.servers.get(server_name)
+        if server_config is None:
+            return None
+        return copy.deepcopy(server_config)
     
     def is_tool_auto_approved(self, server_name: str, tool_name: str) -> bool:
         """Check if a tool is auto-approved"""
-        server_config = self.get_server_config(server_name)
-        if not server_config:
-            return False
+        self._ensure_loaded()
+        if server_name in self._auto_approve_all:
+            return True
         
-        auto_approve = server_config.get("autoApprove", [])
-        return tool_name in auto_approve or "*" in auto_approve
+        auto_approve = self._auto_approve.get(server_name)
+        return auto_approve is not None and tool_name in auto_approve
     
     def get_enabled_tools(self) -> List[str]:
         """Get list of all enabled tool names across all servers"""
-        tools = []
-        for server_name, server_config in self.servers.items():
-            # Extract tool names from server config if available
-            # This is a placeholder - actual implementation depends on MCP protocol
-            tools.append(f"{server_name}.*")
-        return tools
+        # This is a placeholder - actual implementation depends on MCP protocol
+        return [f"{server_name}.*" for server_name in self.servers]
     
     @classmethod
     def create_default_config(cls, output_path: str) -> None:
@@ -166,7 +245,13 @@ class MCPConfig:
         }
         
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        
+        # Serialize to a single buffer and write it in one call
+        if ORJSON_AVAILABLE:
+            Path(output_path).write_bytes(
+                orjson.dumps(default_config, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            Path(output_path).write_text(json.dumps(default_config, indent=2))
         
         logger.info(f"Created default MCP config at: {output_path}")
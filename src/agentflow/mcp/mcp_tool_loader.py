@@ -7,14 +7,129 @@ Dynamically loads and manages tools from MCP servers.
 import subprocess
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass
+import weakref
+from typing import Dict, Any, List, Mapping, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from agentflow.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Default cap on in-flight tool calls per server (server config "maxConcurrent")
+DEFAULT_MAX_CONCURRENT_CALLS = 8
 
-@dataclass
+# tools/list results for common MCP servers, shared by every discovery call
+_BUILTIN_TOOL_MAPPINGS: Dict[str, List[Dict[str, Any]]] = {
+    "filesystem": [
+        {
+            "name": "read_file",
+            "description": "Read contents of a file",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string", "description": "File path"}
+                },
+                "required": ["path"]
+            }
+        },
+        {
+            "name": "write_file",
+            "description": "Write contents to a file",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string", "description": "File path"},
+                    "content": {"type": "string", "description": "File content"}
+                },
+                "required": ["path", "content"]
+            }
+        },
+        {
+            "name": "list_directory",
+            "description": "List contents of a directory",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string", "description": "Directory path"}
+                },
+                "required": ["path"]
+            }
+        }
+    ],
+    "brave-search": [
+        {
+            "name": "search",
+            "description": "Search the web using Brave Search",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"}
+                },
+                "required": ["query"]
+            }
+        }
+    ],
+    "github": [
+        {
+            "name": "search_repositories",
+            "description": "Search GitHub repositories",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"}
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "get_file_contents",
+            "description": "Get contents of a file from a repository",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "owner": {"type": "string"},
+                    "repo": {"type": "string"},
+                    "path": {"type": "string"}
+                },
+                "required": ["owner", "repo", "path"]
+            }
+        }
+    ]
+}
+
+# Canned responses for simulated tool execution, keyed by (server, tool)
+_SIMULATED_HANDLERS: Dict[Tuple[str, str], Callable[[Dict[str, Any]], Any]] = {
+    # Filesystem tools
+    ("filesystem", "read_file"): lambda params: {
+        "content": f"Simulated content of {params.get('path', 'unknown')}"
+    },
+    ("filesystem", "write_file"): lambda params: {
+        "success": True,
+        "message": f"File written: {params.get('path', 'unknown')}"
+    },
+    ("filesystem", "list_directory"): lambda params: {
+        "files": ["file1.txt", "file2.py", "dir1/"]
+    },
+    # Search tools
+    ("brave-search", "search"): lambda params: {
+        "results": [
+            {"title": "Result 1", "url": "https://example.com/1", "snippet": "..."},
+            {"title": "Result 2", "url": "https://example.com/2", "snippet": "..."}
+        ]
+    },
+    # GitHub tools
+    ("github", "search_repositories"): lambda params: {
+        "repositories": [
+            {"name": "repo1", "owner": "user1", "stars": 100},
+            {"name": "repo2", "owner": "user2", "stars": 50}
+        ]
+    },
+    ("github", "get_file_contents"): lambda params: {
+        "content": "# Sample README\n\nThis is a sample file."
+    },
+}
+
+
+@dataclass(slots=True)
 class MCPTool:
     """Represents an MCP tool"""
     name: str
@@ -22,16 +137,23 @@ class MCPTool:
     server_name: str
     input_schema: Dict[str, Any]
     execute_fn: Callable
+    _metadata_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
     
     def to_metadata(self) -> Dict[str, Any]:
-        """Convert to tool metadata format"""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "server": self.server_name,
-            "parameters": self.input_schema.get("properties", {}),
-            "required": self.input_schema.get("required", [])
-        }
+        """
+        Convert to tool metadata format
+        
+        Built on first call and shared afterwards; callers must not mutate it.
+        """
+        if self._metadata_cache is None:
+            self._metadata_cache = {
+                "name": self.name,
+                "description": self.description,
+                "server": self.server_name,
+                "parameters": self.input_schema.get("properties", {}),
+                "required": self.input_schema.get("required", [])
+            }
+        return self._metadata_cache
 
 
 class MCPToolLoader:
@@ -56,6 +178,12 @@ class MCPToolLoader:
         self.config = mcp_config or MCPConfig()
         self.tools: Dict[str, MCPTool] = {}
         self.server_processes: Dict[str, Any] = {}
+        # Built on first use per event loop and server; asyncio semaphores
+        # bind to one loop, and the loader is used from several asyncio.run
+        # calls
+        self._server_semaphores: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]"
+        ) = weakref.WeakKeyDictionary()
         
         logger.info("MCP Tool Loader initialized")
     
@@ -73,11 +201,17 @@ class MCPToolLoader:
         
         logger.info(f"Loading tools from {len(servers_to_load)} MCP servers")
         
-        for server_name in servers_to_load:
-            try:
-                await self._load_server_tools(server_name)
-            except Exception as e:
-                logger.error(f"Failed to load tools from {server_name}: {e}", exc_info=True)
+        # Servers are independent, so discover them concurrently
+        results = await asyncio.gather(
+            *(self._load_server_tools(server_name) for server_name in servers_to_load),
+            return_exceptions=True
+        )
+        for server_name, result in zip(servers_to_load, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to load tools from {server_name}: {result}",
+                    exc_info=result
+                )
         
         logger.info(f"Loaded {len(self.tools)} tools from MCP servers")
         return self.tools
@@ -99,16 +233,17 @@ class MCPToolLoader:
             tools = await self._discover_tools(server_name, server_config)
             
             for tool_info in tools:
+                name = tool_info["name"]
                 tool = MCPTool(
-                    name=tool_info["name"],
+                    name=name,
                     description=tool_info.get("description", ""),
                     server_name=server_name,
                     input_schema=tool_info.get("inputSchema", {}),
-                    execute_fn=self._create_execute_function(server_name, tool_info["name"])
+                    execute_fn=self._create_execute_function(server_name, name)
                 )
                 
                 # Use namespaced tool name to avoid conflicts
-                tool_key = f"{server_name}.{tool['name']}"
+                tool_key = f"{server_name}.{name}"
                 self.tools[tool_key] = tool
                 
                 logger.debug(f"Registered MCP tool: {tool_key}")
@@ -119,7 +254,7 @@ class MCPToolLoader:
     async def _discover_tools(
         self,
         server_name: str,
-        server_config: Dict[str, Any]
+        server_config: Mapping[str, Any]
     ) -> List[Dict[str, Any]]:
         """
         Discover available tools from an MCP server
@@ -128,93 +263,26 @@ class MCPToolLoader:
         1. Start the MCP server process
         2. Send a tools/list request
         3. Parse the response
-        """
-        # Predefined tool mappings for common MCP servers
-        # This allows the system to work without actual MCP server connections
-        
-        tool_mappings = {
-            "filesystem": [
-                {
-                    "name": "read_file",
-                    "description": "Read contents of a file",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "path": {"type": "string", "description": "File path"}
-                        },
-                        "required": ["path"]
-                    }
-                },
-                {
-                    "name": "write_file",
-                    "description": "Write contents to a file",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "path": {"type": "string", "description": "File path"},
-                            "content": {"type": "string", "description": "File content"}
-                        },
-                        "required": ["path", "content"]
-                    }
-                },
-                {
-                    "name": "list_directory",
-                    "description": "List contents of a directory",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "path": {"type": "string", "description": "Directory path"}
-                        },
-                        "required": ["path"]
-                    }
-                }
-            ],
-            "brave-search": [
-                {
-                    "name": "search",
-                    "description": "Search the web using Brave Search",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"}
-                        },
-                        "required": ["query"]
-                    }
-                }
-            ],
-            "github": [
-                {
-                    "name": "search_repositories",
-                    "description": "Search GitHub repositories",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"}
-                        },
-                        "required": ["query"]
-                    }
-                },
-                {
-                    "name": "get_file_contents",
-                    "description": "Get contents of a file from a repository",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "owner": {"type": "string"},
-                            "repo": {"type": "string"},
-                            "path": {"type": "string"}
-                        },
-                        "required": ["owner", "repo", "path"]
-                    }
-                }
-            ]
-        }
         
-        return tool_mappings.get(server_name, [])
+        The returned tool definitions are shared; callers must not mutate them.
+        """
+        # Predefined tool mappings for common MCP servers allow the system
+        # to work without actual MCP server connections
+        return _BUILTIN_TOOL_MAPPINGS.get(server_name, [])
+    
+    def _server_semaphore(self, server_name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent calls to a server on the running loop"""
+        semaphores = self._server_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(server_name)
+        if semaphore is None:
+            server_config = self.config.get_server_config(server_name) or {}
+            semaphore = semaphores[server_name] = asyncio.Semaphore(
+                server_config.get("maxConcurrent", DEFAULT_MAX_CONCURRENT_CALLS)
+            )
+        return semaphore
     
     def _create_execute_function(self, server_name: str, tool_name: str) -> Callable:
         """Create an execution function for an MCP tool"""
-        
         async def execute(**kwargs) -> Any:
             """Execute the MCP tool"""
             logger.info(f"Executing MCP tool: {server_name}.{tool_name}")
@@ -223,7 +291,10 @@ class MCPToolLoader:
             try:
                 # In production, this would send a tools/call request to the MCP server
                 # For now, we'll simulate execution
-                result = await self._simulate_tool_execution(server_name, tool_name, kwargs)
+                # Shared by every tool on the server so a planner fan-out
+                # cannot overwhelm it
+                async with self._server_semaphore(server_name):
+                    result = await self._simulate_tool_execution(server_name, tool_name, kwargs)
                 
                 logger.info(f"MCP tool execution completed: {server_name}.{tool_name}")
                 return result
@@ -241,37 +312,9 @@ class MCPToolLoader:
         params: Dict[str, Any]
     ) -> Any:
         """Simulate MCP tool execution"""
-        
-        # Filesystem tools
-        if server_name == "filesystem":
-            if tool_name == "read_file":
-                return {"content": f"Simulated content of {params.get('path', 'unknown')}"}
-            elif tool_name == "write_file":
-                return {"success": True, "message": f"File written: {params.get('path', 'unknown')}"}
-            elif tool_name == "list_directory":
-                return {"files": ["file1.txt", "file2.py", "dir1/"]}
-        
-        # Search tools
-        elif server_name == "brave-search":
-            if tool_name == "search":
-                return {
-                    "results": [
-                        {"title": "Result 1", "url": "https://example.com/1", "snippet": "..."},
-                        {"title": "Result 2", "url": "https://example.com/2", "snippet": "..."}
-                    ]
-                }
-        
-        # GitHub tools
-        elif server_name == "github":
-            if tool_name == "search_repositories":
-                return {
-                    "repositories": [
-                        {"name": "repo1", "owner": "user1", "stars": 100},
-                        {"name": "repo2", "owner": "user2", "stars": 50}
-                    ]
-                }
-            elif tool_name == "get_file_contents":
-                return {"content": "# Sample README\n\nThis is a sample file."}
+        handler = _SIMULATED_HANDLERS.get((server_name, tool_name))
+        if handler is not None:
+            return handler(params)
         
         # Generic fallback
         return {"result": f"Simulated execution of {server_name}.{tool_name}", "params": params}
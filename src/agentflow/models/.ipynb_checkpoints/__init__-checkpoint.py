@@ -1,16 +0,0 @@
-"""Model integrations for AgentFlow"""
-
-from agentflow.models.bedrock_client import BedrockClient, ModelType
-
-__all__ = [
-    "BedrockClient",
-    "ModelType",
-    "Executor",
-    "QueryAnalysis(BaseModel)",
-    "Initializer",
-    "Memory",
-    "Planner",
-    "NextStep(BaseModel)",
-    "MemoryVerification(BaseModel)",
-    "ToolCommand(BaseModel)",
-]
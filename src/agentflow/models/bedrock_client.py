@@ -2,25 +2,82 @@
 Amazon Bedrock client for model interactions
 """
 
+import asyncio
+import contextvars
+import functools
 import json
-from typing import Any, Dict, Optional, List
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, List, Tuple
 from enum import Enum
 import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError
 import structlog
 from tenacity import (
-    retry,
+    AsyncRetrying,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type
+    retry_if_exception
 )
 
 from agentflow.utils.logging import setup_logger
 from agentflow.utils.exceptions import BedrockError, ModelInvocationError
 
+# Try to import orjson for faster request/response (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = setup_logger(__name__)
 
+# Default cap on concurrent requests per client (AGENTFLOW_BEDROCK_CONCURRENCY)
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Anthropic prompt-caching breakpoint
+_EPHEMERAL = {"type": "ephemeral"}
+
+# boto3 clients shared by BedrockClient(shared_client=True), keyed by
+# (region, max_retries, timeout, max_pool_connections)
+_BEDROCK_CLIENT_CACHE: Dict[Tuple[str, int, int, int], Any] = {}
+_BEDROCK_CLIENT_LOCK = threading.Lock()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a request body, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Both accept the raw bytes Bedrock returns, so no UTF-8 decode is needed
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Bedrock error codes worth retrying; other client errors (validation,
+# access denied, missing model) fail the same way on every attempt
+_RETRYABLE_ERROR_CODES = frozenset({
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "InternalServerException",
+    "ModelTimeoutException",
+    "ModelNotReadyException",
+})
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry predicate for invoke, which wraps ClientError in ModelInvocationError"""
+    if not isinstance(exc, (ClientError, ModelInvocationError)):
+        return False
+    client_error = exc if isinstance(exc, ClientError) else exc.__cause__
+    if isinstance(client_error, ClientError):
+        code = client_error.response.get("Error", {}).get("Code", "")
+        return code in _RETRYABLE_ERROR_CODES
+    return True
+
 
 class ModelType(Enum):
     """Supported Bedrock model types"""
@@ -45,25 +102,74 @@ class BedrockClient:
         self,
         region_name: str = "us-east-1",
         max_retries: int = 3,
-        timeout: int = 300
+        timeout: int = 300,
+        max_concurrency: Optional[int] = None,
+        shared_client: bool = False
     ):
+        """
+        Args:
+            region_name: AWS region of the Bedrock runtime endpoint
+            max_retries: Attempts made by invoke on transient errors (1
+                disables invoke's retries)
+            timeout: Connect and read timeout in seconds
+            max_concurrency: Cap on in-flight requests through this client
+                (defaults to AGENTFLOW_BEDROCK_CONCURRENCY or 10)
+            shared_client: Reuse the boto3 client of any earlier BedrockClient
+                created with the same settings instead of building a new one
+        """
         self.region_name = region_name
         self.max_retries = max_retries
         self.timeout = timeout
         
-        # Configure boto3 client with retries
+        if max_concurrency is None:
+            max_concurrency = int(
+                os.environ.get("AGENTFLOW_BEDROCK_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+            )
+        self.max_concurrency = max_concurrency
+        
+        # Caps in-flight requests across every agent sharing this client, so a
+        # fan-out cannot set off a throttling storm. asyncio semaphores bind
+        # to one loop, so one is created per loop (see semaphore)
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        
+        # Built once; with max_retries=1 invoke and streaming make one attempt
+        # each and skip the retry machinery entirely
+        self._invoke_retrying = self._with_retries(self._invoke_once)
+        self._open_stream_retrying = self._with_retries(self._open_stream)
+        
+        # Blocking boto3 calls get their own pool, sized to the semaphore, so
+        # a burst of requests cannot starve the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="bedrock"
+        )
+        
+        # invoke owns retries, so botocore sends each request once (its
+        # max_attempts would count retries, not attempts); adaptive mode still
+        # rate-limits after throttling
         config = Config(
             region_name=region_name,
             retries={
-                'max_attempts': max_retries,
+                'total_max_attempts': 1,
                 'mode': 'adaptive'
             },
             connect_timeout=timeout,
-            read_timeout=timeout
+            read_timeout=timeout,
+            max_pool_connections=max(max_concurrency, 10)
         )
         
         try:
-            self.client = boto3.client('bedrock-runtime', config=config)
+            if shared_client:
+                key = (region_name, max_retries, timeout, config.max_pool_connections)
+                # boto3 client creation is not thread-safe and takes hundreds of ms
+                with _BEDROCK_CLIENT_LOCK:
+                    self.client = _BEDROCK_CLIENT_CACHE.get(key)
+                    if self.client is None:
+                        self.client = boto3.client('bedrock-runtime', config=config)
+                        _BEDROCK_CLIENT_CACHE[key] = self.client
+            else:
+                self.client = boto3.client('bedrock-runtime', config=config)
             self.logger = logger.bind(region=region_name)
             self.logger.info("Bedrock client initialized")
         except Exception as e:
@@ -71,6 +177,35 @@ class BedrockClient:
             self.logger.error(f"Failed to initialize Bedrock client: {str(e)}")
             raise BedrockError(f"Failed to initialize Bedrock client: {str(e)}") from e
 
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        Concurrency gate for the running event loop, created on first use
+
+        A client reused across several asyncio.run calls gets a fresh gate
+        per loop; the worker pool still caps blocking calls across loops.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _with_retries(self, func):
+        """Wrap an async call to retry transient errors up to max_retries attempts"""
+        if self.max_retries <= 1:
+            return func
+        return AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential(multiplier=1, min=2, max=10),
+            retry=retry_if_exception(_is_retryable),
+            reraise=True
+        ).wraps(func)
+
+    def close(self) -> None:
+        """Shut down the worker threads; the client cannot be used afterwards"""
+        self._executor.shutdown(wait=False)
+
     def _is_claude_model(self, model_type: ModelType) -> bool:
         """Check if the model is a Claude model"""
         return model_type in [ModelType.SONNET_4_5, ModelType.HAIKU_4_5]
@@ -83,22 +218,33 @@ class BedrockClient:
         temperature: float = 0.7,
         max_tokens: int = 4096,
         tools: Optional[List[Dict[str, Any]]] = None,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        cached_prefix: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Prepare request body based on model type
 
         Both Claude and Qwen models use the messages format.
         The main difference is in the version field and some optional parameters.
+
+        When ``cached_prefix`` is given for a Claude model, the system prompt,
+        tool definitions and that leading part of the prompt are marked with
+        ``cache_control`` breakpoints so Bedrock can reuse their prefill.
         """
         if self._is_claude_model(model_type):
+            content: Any = prompt
+            if cached_prefix and prompt.startswith(cached_prefix):
+                content = [{"type": "text", "text": cached_prefix, "cache_control": _EPHEMERAL}]
+                if len(prompt) > len(cached_prefix):
+                    content.append({"type": "text", "text": prompt[len(cached_prefix):]})
+
             # Claude format with Anthropic version
             request_body = {
                 "anthropic_version": "bedrock-2023-05-31",
                 "messages": [
                     {
                         "role": "user",
-                        "content": prompt
+                        "content": content
                     }
                 ],
                 "max_tokens": max_tokens,
@@ -106,9 +252,17 @@ class BedrockClient:
             }
 
             if system_prompt:
-                request_body["system"] = system_prompt
+                if cached_prefix is not None:
+                    request_body["system"] = [
+                        {"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}
+                    ]
+                else:
+                    request_body["system"] = system_prompt
 
             if tools:
+                if cached_prefix is not None:
+                    # A breakpoint on the last tool caches the whole tool list
+                    tools = [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
                 request_body["tools"] = tools
 
             if stop_sequences:
@@ -259,12 +413,88 @@ class BedrockClient:
 
             return normalized
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((ClientError, ModelInvocationError)),
-        reraise=True
-    )
+    @staticmethod
+    def _normalize_stream_chunk(chunk_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize a Qwen streaming chunk to Claude's streaming event format
+
+        Text chunks become content_block_delta events; anything else is
+        passed through as-is.
+        """
+        # Already in Claude-like format
+        if 'type' in chunk_data and 'delta' in chunk_data:
+            return chunk_data
+
+        # OpenAI-style chunk: {"choices": [{"delta": {"content": "..."}}]}
+        text = None
+        choices = chunk_data.get('choices')
+        if isinstance(choices, list) and choices:
+            delta = choices[0].get('delta') or {}
+            text = delta.get('content', choices[0].get('text'))
+        elif 'token' in chunk_data or 'text' in chunk_data:
+            text = chunk_data.get('token', chunk_data.get('text', ''))
+
+        if text is None:
+            return chunk_data
+        return {
+            "type": "content_block_delta",
+            "delta": {"type": "text_delta", "text": text}
+        }
+
+    async def _open_stream(self, model_id: str, body: str) -> Dict[str, Any]:
+        """Make a single attempt at opening a response stream"""
+        return await self._run_blocking(
+            self.client.invoke_model_with_response_stream,
+            modelId=model_id,
+            body=body,
+            contentType="application/json",
+            accept="application/json"
+        )
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking boto3 call on the client's executor"""
+        loop = asyncio.get_running_loop()
+        # Carry bound log context into the worker, as asyncio.to_thread does
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def _invoke_model(
+        self,
+        model_type: ModelType,
+        request_body: Dict[str, Any],
+        tools_json: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send a prepared request body to Bedrock and normalize the response"""
+        body = _dumps(request_body)
+        if tools_json and self._is_claude_model(model_type):
+            # Splice in the caller's pre-serialized tool definitions
+            body = f'{body[:-1]}, "tools": {tools_json}}}'
+
+        # Invoke model
+        response = self.client.invoke_model(
+            modelId=model_type.value,
+            body=body,
+            contentType="application/json",
+            accept="application/json"
+        )
+
+        # Parse response
+        response_body = _loads(response['body'].read())
+
+        # Log raw response for debugging (especially for non-Claude models)
+        if not self._is_claude_model(model_type):
+            self.logger.debug(
+                f"Raw {model_type.name} response",
+                response_preview=str(response_body)[:500]
+            )
+            # Also print to console for easier debugging
+            print(f"\n=== RAW {model_type.name} RESPONSE ===")
+            print(json.dumps(response_body, indent=2))
+            print("=" * 50 + "\n")
+
+        # Normalize response to ensure consistent format
+        return self._normalize_response(model_type, response_body)
+
     async def invoke(
         self,
         model_type: ModelType,
@@ -273,7 +503,10 @@ class BedrockClient:
         temperature: float = 0.7,
         max_tokens: int = 4096,
         tools: Optional[List[Dict[str, Any]]] = None,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        cached_prefix: Optional[str] = None,
+        tools_json: Optional[str] = None,
+        retry: bool = True
     ) -> Dict[str, Any]:
         """
         Invoke a Bedrock model
@@ -289,10 +522,42 @@ class BedrockClient:
             max_tokens: Maximum tokens to generate
             tools: Tool definitions for function calling (Claude models only)
             stop_sequences: Sequences that stop generation
+            cached_prefix: Static leading part of the prompt to cache along with
+                the system prompt and tools (Claude models only)
+            tools_json: Pre-serialized JSON array of tool definitions, sent
+                as-is in place of tools (Claude models only)
+            retry: Retry transient errors up to max_retries attempts; callers
+                with their own retry policy pass False
 
         Returns:
             Model response dictionary in normalized Claude-compatible format
         """
+        invoke = self._invoke_retrying if retry else self._invoke_once
+        return await invoke(
+            model_type,
+            prompt,
+            system_prompt,
+            temperature,
+            max_tokens,
+            tools,
+            stop_sequences,
+            cached_prefix,
+            tools_json
+        )
+
+    async def _invoke_once(
+        self,
+        model_type: ModelType,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        tools: Optional[List[Dict[str, Any]]],
+        stop_sequences: Optional[List[str]],
+        cached_prefix: Optional[str],
+        tools_json: Optional[str]
+    ) -> Dict[str, Any]:
+        """Make a single model invocation attempt"""
         model_id = model_type.value
         
         self.logger.info(
@@ -311,33 +576,16 @@ class BedrockClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 tools=tools,
-                stop_sequences=stop_sequences
-            )
-
-            # Invoke model
-            response = self.client.invoke_model(
-                modelId=model_id,
-                body=json.dumps(request_body),
-                contentType="application/json",
-                accept="application/json"
+                stop_sequences=stop_sequences,
+                cached_prefix=cached_prefix
             )
 
-            # Parse response
-            response_body = json.loads(response['body'].read())
-
-            # Log raw response for debugging (especially for non-Claude models)
-            if not self._is_claude_model(model_type):
-                self.logger.debug(
-                    f"Raw {model_type.name} response",
-                    response_preview=str(response_body)[:500]
+            # boto3 blocks, so the request runs in a worker thread to keep
+            # the event loop free for other agents
+            async with self.semaphore:
+                normalized_response = await self._run_blocking(
+                    self._invoke_model, model_type, request_body, tools_json
                 )
-                # Also print to console for easier debugging
-                print(f"\n=== RAW {model_type.name} RESPONSE ===")
-                print(json.dumps(response_body, indent=2))
-                print("=" * 50 + "\n")
-
-            # Normalize response to ensure consistent format
-            normalized_response = self._normalize_response(model_type, response_body)
 
             self.logger.info(
                 "Model invocation successful",
@@ -380,13 +628,15 @@ class BedrockClient:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None
     ):
         """
         Invoke model with streaming response
 
         Yields response chunks as they arrive.
         Note: Response chunks are normalized to Claude format for consistency.
+        Closing the generator early closes the underlying response stream.
         """
         model_id = model_type.value
 
@@ -401,44 +651,34 @@ class BedrockClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 tools=None,
-                stop_sequences=None
+                stop_sequences=None,
+                cached_prefix=cached_prefix
             )
 
-            response = self.client.invoke_model_with_response_stream(
-                modelId=model_id,
-                body=json.dumps(request_body),
-                contentType="application/json",
-                accept="application/json"
-            )
-
-            stream = response.get('body')
-            if stream:
-                for event in stream:
-                    chunk = event.get('chunk')
-                    if chunk:
-                        chunk_data = json.loads(chunk.get('bytes').decode())
-                        # For Qwen models, normalize streaming chunks to Claude format
-                        if not self._is_claude_model(model_type):
-                            # Qwen streaming chunk format may differ
-                            # Check if already in Claude format
-                            if 'type' in chunk_data and 'delta' in chunk_data:
-                                # Already in Claude-like format
-                                yield chunk_data
-                            elif 'token' in chunk_data or 'text' in chunk_data:
-                                # Normalize to Claude-like streaming format
-                                normalized_chunk = {
-                                    "type": "content_block_delta",
-                                    "delta": {
-                                        "type": "text_delta",
-                                        "text": chunk_data.get('token', chunk_data.get('text', ''))
-                                    }
-                                }
-                                yield normalized_chunk
-                            else:
-                                # Pass through as-is
-                                yield chunk_data
-                        else:
-                            yield chunk_data
+            # The stream holds a connection until it is closed, so it counts
+            # against the concurrency cap for its whole lifetime
+            async with self.semaphore:
+                # Nothing has been yielded until the stream opens, so only
+                # opening it is retried
+                response = await self._open_stream_retrying(model_id, _dumps(request_body))
+
+                stream = response.get('body')
+                if stream:
+                    try:
+                        # Reading each event blocks on the socket, so pull them from
+                        # a worker thread too
+                        events = iter(stream)
+                        while (event := await self._run_blocking(next, events, None)) is not None:
+                            chunk = event.get('chunk')
+                            if chunk:
+                                chunk_data = _loads(chunk.get('bytes'))
+                                if self._is_claude_model(model_type):
+                                    yield chunk_data
+                                else:
+                                    yield self._normalize_stream_chunk(chunk_data)
+                    finally:
+                        # Frees the connection when the caller stops reading early
+                        stream.close()
 
             self.logger.info("Streaming invocation completed", model=model_id)
 
@@ -10,14 +10,20 @@ Supports multiple model types:
 - Qwen 3-32B (ModelType.QWEN_3_32B)
 """
 
+import ast
+import functools
+import hashlib
 import importlib
 import json
 import os
 import re
-import signal
+import threading
+import time
 import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError as FutureTimeoutError, wait
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agentflow.models.bedrock_client import BedrockClient, ModelType
 from agentflow.utils.logging import setup_logger
@@ -66,18 +72,134 @@ TOOL_NAME_MAPPING_SHORT = {
     "Wikipedia_Search_Tool": "Wikipedia_RAG_Search_Tool"
 }
 
+# Long and short tool names -> (dir_name, class_name), built from the mappings above
+TOOL_NAME_INDEX: Dict[str, Tuple[str, str]] = {
+    long_name: (mapping["dir_name"], mapping["class_name"])
+    for long_name, mapping in TOOL_NAME_MAPPING_LONG.items()
+}
+TOOL_NAME_INDEX.update(
+    (short_name, TOOL_NAME_INDEX[long_name])
+    for short_name, long_name in TOOL_NAME_MAPPING_SHORT.items()
+    if long_name in TOOL_NAME_INDEX
+)
+
+
+# Patterns for parsing generated tool commands, compiled once
+_CMD_PATTERN = re.compile(r"Generated Command:.*?```python\n(.*?)```", re.DOTALL | re.IGNORECASE)
+_LOOSE_PATTERN = re.compile(r"```python\s*\n(.*?)```", re.DOTALL | re.IGNORECASE)
+_ANALYSIS_PATTERN = re.compile(
+    r"Analysis:(.*?)(?:Command Explanation|Generated Command)", re.DOTALL | re.IGNORECASE
+)
+_EXPLANATION_PATTERN = re.compile(
+    r"Command Explanation:(.*?)Generated Command", re.DOTALL | re.IGNORECASE
+)
+_BACKTICK_STRIP = re.compile(r'^```python\s*')
+_SPLIT_PATTERN = re.compile(r'.*?execution\s*=\s*tool\.execute\([^\n]*\)\s*(?:\n|$)', re.DOTALL)
+_EXECUTE_PATTERN = re.compile(r'tool\.execute\(([^)]+)\)')
 
-# Timeout handling
-try:
-    TimeoutError
-except NameError:
-    class TimeoutError(Exception):
-        pass
 
+# Static instructions for tool command generation. Sent as the system prompt
+# so Claude models can serve it (and the per-tool prefix) from the prompt cache
+_TOOL_COMMAND_INSTRUCTIONS = """
+Task: Generate a precise command to execute the selected tool.
+
+Instructions:
+1. Analyze the tool's required parameters from its metadata.
+2. Construct valid Python code that addresses the sub-goal using the provided context and data.
+3. The command must include at least one call to `tool.execute()`.
+4. Each `tool.execute()` call must be assigned to a variable named **`execution`**.
+5. Please give the exact numbers and parameters should be used in the `tool.execute()` call.
+
+Output Format:
+Present your response in the following structured format. Do not include any extra text or explanations.
 
-def timeout_handler(signum, frame):
-    """Signal handler for timeout"""
-    raise TimeoutError("Function execution timed out")
+Generated Command:
+```python
+<command>
+```
+
+Example1:
+Generated Command:
+```python
+execution = tool.execute(query="Summarize the following problem: Isaac has 100 toys, masa gets ...., how much are their together?")
+```
+
+Example2:
+Generated Command:
+```python
+execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's Last Theorem"])
+```
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _load_tool_class(dir_name: str, class_name: str) -> type:
+    """Import a tool module and return its tool class (failed imports are not cached)"""
+    module = importlib.import_module(f"tools.{dir_name}.tool")
+    return getattr(module, class_name)
+
+
+def _parse_execute_call(block: str) -> Optional[Tuple[List[Any], Dict[str, Any]]]:
+    """
+    Parse a block of the form ``execution = tool.execute(...)`` with literal arguments
+    
+    Returns:
+        (args, kwargs) for the call, or None if the block has any other shape
+    """
+    try:
+        tree = ast.parse(block, mode="exec")
+    except SyntaxError:
+        return None
+    
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.Assign):
+        return None
+    assign = tree.body[0]
+    call = assign.value
+    if not (
+        len(assign.targets) == 1
+        and isinstance(assign.targets[0], ast.Name)
+        and assign.targets[0].id == "execution"
+        and isinstance(call, ast.Call)
+        and isinstance(call.func, ast.Attribute)
+        and call.func.attr == "execute"
+        and isinstance(call.func.value, ast.Name)
+        and call.func.value.id == "tool"
+    ):
+        return None
+    
+    try:
+        args = [ast.literal_eval(arg) for arg in call.args]
+        kwargs = {}
+        for keyword in call.keywords:
+            if keyword.arg is None:
+                return None
+            kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        return None
+    return args, kwargs
+
+
+# Generated tool commands persisted in the query cache directory
+_COMMAND_CACHE_FILE = "tool_cmd_cache.jsonl"
+
+
+def _start_block(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run fn(*args) in a fresh daemon thread and return its future
+
+    Running blocks cannot be interrupted, so a timed-out block is abandoned
+    with its thread; it never holds up blocks started later.
+    """
+    future: Future = Future()
+
+    def target() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name="tool-exec", daemon=True).start()
+    return future
 
 
 class Executor:
@@ -100,7 +222,8 @@ class Executor:
         verbose: bool = False,
         temperature: float = 0.0,
         enable_mcp: bool = True,
-        mcp_config_path: Optional[str] = None
+        mcp_config_path: Optional[str] = None,
+        command_cache_size: int = 0
     ):
         """
         Initialize executor with BedrockClient
@@ -111,13 +234,17 @@ class Executor:
             bedrock_client: BedrockClient instance for model invocations
             model_type: Bedrock model to use (SONNET_4_5, HAIKU_4_5, or QWEN_3_32B)
             root_cache_dir: Root directory for caching
-            num_threads: Number of threads for execution
+            num_threads: Blocks of a multi-call command run at once; above 1,
+                they overlap
             max_time: Maximum execution time in seconds
             max_output_length: Maximum output length
             verbose: Enable verbose logging
             temperature: Sampling temperature
             enable_mcp: Enable MCP tool loading
             mcp_config_path: Custom MCP config path
+            command_cache_size: Generated tool commands kept for reuse when
+                temperature is 0 (the default, 0, disables the cache). Keys
+                cover the whole prompt, so edited tool metadata misses
         """
         self.bedrock_client = bedrock_client
         self.model_type = model_type
@@ -129,6 +256,12 @@ class Executor:
         self.temperature = temperature
         self.query_cache_dir: Optional[str] = None
         
+        # Generated commands keyed by a digest of the model, temperature and prompt
+        self.command_cache_size = command_cache_size
+        self._command_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Lines in the current query cache directory's command cache file
+        self._persisted_commands = 0
+        
         # MCP tool support
         self.mcp_loader: Optional[Any] = None
         self.mcp_tools: Dict[str, Any] = {}
@@ -165,12 +298,71 @@ class Executor:
             self.query_cache_dir = os.path.join(self.root_cache_dir, timestamp)
         
         os.makedirs(self.query_cache_dir, exist_ok=True)
+        self._load_command_cache()
         
         logger.info(
             "Query cache directory set",
             cache_dir=self.query_cache_dir
         )
     
+    def _command_cache_key(self, prompt: str) -> str:
+        """Digest of the prompt and the settings that shape the generated command"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.model_type.value}\0{self.temperature}\0".encode())
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+    
+    def _cache_command(self, key: str, command: str, persist: bool = True) -> None:
+        """Store a generated command, evicting the least recently used one when full"""
+        self._command_cache[key] = command
+        self._command_cache.move_to_end(key)
+        if len(self._command_cache) > self.command_cache_size:
+            self._command_cache.popitem(last=False)
+        
+        if persist and self.query_cache_dir:
+            path = os.path.join(self.query_cache_dir, _COMMAND_CACHE_FILE)
+            try:
+                # Appends are cheap, but evicted and repeated entries pile up;
+                # past twice the cache size the file is rewritten
+                if self._persisted_commands >= 2 * self.command_cache_size:
+                    self._compact_command_cache(path)
+                else:
+                    with open(path, "a") as f:
+                        f.write(json.dumps({"key": key, "command": command}) + "\n")
+                    self._persisted_commands += 1
+            except OSError as e:
+                logger.warning(f"Failed to persist tool command cache: {e}")
+    
+    def _compact_command_cache(self, path: str) -> None:
+        """Rewrite the command cache file with only the cached entries"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            for key, command in self._command_cache.items():
+                f.write(json.dumps({"key": key, "command": command}) + "\n")
+        os.replace(tmp_path, path)
+        self._persisted_commands = len(self._command_cache)
+    
+    def _load_command_cache(self) -> None:
+        """Warm the command cache from the query cache directory"""
+        if not self.command_cache_size or not self.query_cache_dir:
+            return
+        
+        self._persisted_commands = 0
+        path = os.path.join(self.query_cache_dir, _COMMAND_CACHE_FILE)
+        try:
+            with open(path) as f:
+                for line in f:
+                    self._persisted_commands += 1
+                    try:
+                        entry = json.loads(line)
+                        self._cache_command(entry["key"], entry["command"], persist=False)
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to load tool command cache: {e}")
+    
     async def load_mcp_tools(self, server_names: Optional[List[str]] = None) -> None:
         """
         Load tools from MCP servers
@@ -224,42 +416,16 @@ class Executor:
         Returns:
             Generated tool command
         """
-        prompt_generate_tool_command = f"""
-Task: Generate a precise command to execute the selected tool.
-
+        # The tool part is the same for every call to a given tool, so it
+        # leads the prompt and is cached along with the instructions
+        tool_prefix = f"""
 Context:
-- **Query:** {question}
-- **Sub-Goal:** {sub_goal}
 - **Tool Name:** {tool_name}
 - **Tool Metadata:** {tool_metadata}
+"""
+        prompt_generate_tool_command = f"""{tool_prefix}- **Query:** {question}
+- **Sub-Goal:** {sub_goal}
 - **Relevant Data:** {context}
-
-Instructions:
-1. Analyze the tool's required parameters from its metadata.
-2. Construct valid Python code that addresses the sub-goal using the provided context and data.
-3. The command must include at least one call to `tool.execute()`.
-4. Each `tool.execute()` call must be assigned to a variable named **`execution`**.
-5. Please give the exact numbers and parameters should be used in the `tool.execute()` call.
-
-Output Format:
-Present your response in the following structured format. Do not include any extra text or explanations.
-
-Generated Command:
-```python
-<command>
-```
-
-Example1:
-Generated Command:
-```python
-execution = tool.execute(query="Summarize the following problem: Isaac has 100 toys, masa gets ...., how much are their together?")
-```
-
-Example2:
-Generated Command:
-```python
-execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's Last Theorem"])
-```
 """
         
         if self.verbose:
@@ -269,17 +435,49 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
                 sub_goal=sub_goal[:100]
             )
         
+        # Only deterministic generations are reused; sampled ones are
+        # expected to differ between calls
+        cache_key = None
+        if self.command_cache_size and self.temperature == 0:
+            cache_key = self._command_cache_key(prompt_generate_tool_command)
+            tool_command = self._command_cache.get(cache_key)
+            if tool_command is not None:
+                self._command_cache.move_to_end(cache_key)
+                if json_data is not None:
+                    json_data[f"tool_commander_{step_count}_prompt"] = prompt_generate_tool_command
+                    json_data[f"tool_commander_{step_count}_response"] = tool_command
+                logger.info("Tool command served from cache", tool_name=tool_name)
+                return tool_command
+        
         try:
-            # Use BedrockClient instead of llm_engine
-            response = await self.bedrock_client.invoke(
+            # Stream the response and stop once the generated command block is
+            # complete; nothing after it is used
+            chunks: List[str] = []
+            usage: Dict[str, Any] = {}
+            stream = self.bedrock_client.invoke_with_streaming(
                 model_type=self.model_type,
                 prompt=prompt_generate_tool_command,
+                system_prompt=_TOOL_COMMAND_INSTRUCTIONS,
                 temperature=self.temperature,
-                max_tokens=2048
+                max_tokens=2048,
+                cached_prefix=tool_prefix
             )
+            try:
+                async for event in stream:
+                    event_type = event.get("type")
+                    if event_type == "content_block_delta":
+                        text = event.get("delta", {}).get("text", "")
+                        chunks.append(text)
+                        if "`" in text and _CMD_PATTERN.search("".join(chunks)):
+                            break
+                    elif event_type == "message_start":
+                        usage = event.get("message", {}).get("usage", {})
+            finally:
+                await stream.aclose()
             
-            # Extract text from response
-            tool_command = response.get("content", [{}])[0].get("text", "")
+            tool_command = "".join(chunks)
+            if cache_key is not None and tool_command:
+                self._cache_command(cache_key, tool_command)
             
             # Log to json_data if provided
             if json_data is not None:
@@ -289,7 +487,9 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
             logger.info(
                 "Tool command generated successfully",
                 tool_name=tool_name,
-                command_length=len(tool_command)
+                command_length=len(tool_command),
+                cache_read_input_tokens=usage.get("cache_read_input_tokens", 0),
+                cache_creation_input_tokens=usage.get("cache_creation_input_tokens", 0)
             )
             
             return tool_command
@@ -317,7 +517,7 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
         """
         def normalize_code(code: str) -> str:
             """Remove leading/trailing whitespace and triple backticks"""
-            return re.sub(r'^```python\s*', '', code).rstrip('```').strip()
+            return _BACKTICK_STRIP.sub('', code).rstrip('```').strip()
         
         analysis = "No analysis found."
         explanation = "No explanation found."
@@ -326,15 +526,13 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
         try:
             if isinstance(response, str):
                 # Extract command using "Generated Command:" prefix
-                command_pattern = r"Generated Command:.*?```python\n(.*?)```"
-                command_match = re.search(command_pattern, response, re.DOTALL | re.IGNORECASE)
+                command_match = _CMD_PATTERN.search(response)
                 
                 if command_match:
                     command = command_match.group(1).strip()
                 else:
                     # Fallback: Extract ANY ```python ... ``` block
-                    loose_command_pattern = r"```python\s*\n(.*?)```"
-                    loose_match = re.findall(loose_command_pattern, response, re.DOTALL | re.IGNORECASE)
+                    loose_match = _LOOSE_PATTERN.findall(response)
                     
                     if loose_match:
                         # Take the longest one as heuristic
@@ -343,13 +541,11 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
                         command = "No command found."
                 
                 # Try to extract analysis and explanation if present
-                analysis_pattern = r"Analysis:(.*?)(?:Command Explanation|Generated Command)"
-                analysis_match = re.search(analysis_pattern, response, re.DOTALL | re.IGNORECASE)
+                analysis_match = _ANALYSIS_PATTERN.search(response)
                 if analysis_match:
                     analysis = analysis_match.group(1).strip()
                 
-                explanation_pattern = r"Command Explanation:(.*?)Generated Command"
-                explanation_match = re.search(explanation_pattern, response, re.DOTALL | re.IGNORECASE)
+                explanation_match = _EXPLANATION_PATTERN.search(response)
                 if explanation_match:
                     explanation = explanation_match.group(1).strip()
             
@@ -391,37 +587,93 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
         """
         def split_commands(command: str) -> List[str]:
             """Split command into individual tool.execute() blocks"""
-            pattern = r'.*?execution\s*=\s*tool\.execute\([^\n]*\)\s*(?:\n|$)'
-            blocks = re.findall(pattern, command, re.DOTALL)
+            blocks = _SPLIT_PATTERN.findall(command)
             return [block.strip() for block in blocks if block.strip()]
         
-        def execute_with_timeout(block: str, local_context: dict) -> Optional[str]:
-            """Execute a command block with timeout protection"""
-            # Set up the timeout handler
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(self.max_time)
+        def run_block(block: str, tool: Any) -> Optional[str]:
+            """Execute a command block and return its execution result"""
+            # Plain literal calls skip compiling and exec'ing the block
+            call = _parse_execute_call(block)
+            if call is not None:
+                args, kwargs = call
+                return tool.execute(*args, **kwargs)
             
-            try:
-                # Execute the block in the local context
-                exec(block, globals(), local_context)
-                result = local_context.get('execution')
-                signal.alarm(0)  # Disable the alarm
-                return result
-            except TimeoutError:
-                logger.warning(
-                    f"Execution timed out after {self.max_time} seconds",
-                    tool_name=tool_name
-                )
-                return f"Execution timed out after {self.max_time} seconds"
-            except Exception as e:
-                logger.error(
-                    f"Error executing block: {str(e)}",
-                    tool_name=tool_name,
-                    exc_info=True
-                )
-                return f"Error executing block: {str(e)}"
-            finally:
-                signal.alarm(0)  # Ensure alarm is disabled
+            # Anything else runs in its own local context
+            local_context = {'tool': tool}
+            exec(block, globals(), local_context)
+            return local_context.get('execution')
+        
+        def timed_out() -> str:
+            """Report a block abandoned while still running"""
+            message = f"Execution timed out after {self.max_time} seconds"
+            logger.warning(message, tool_name=tool_name)
+            return message
+        
+        def execute_sequential(
+            blocks: List[str], make_tool: Callable[[], Any]
+        ) -> List[Optional[str]]:
+            """Execute command blocks one at a time on one tool instance"""
+            tool = make_tool()
+            results = []
+            for block in blocks:
+                future = _start_block(run_block, block, tool)
+                try:
+                    results.append(future.result(timeout=self.max_time))
+                except FutureTimeoutError:
+                    results.append(timed_out())
+                    # The abandoned block may still be using the instance
+                    tool = make_tool()
+                except Exception as e:
+                    logger.error(
+                        f"Error executing block: {str(e)}",
+                        tool_name=tool_name,
+                        exc_info=True
+                    )
+                    results.append(f"Error executing block: {str(e)}")
+            return results
+        
+        def execute_parallel(
+            blocks: List[str], make_tool: Callable[[], Any]
+        ) -> List[Optional[str]]:
+            """Execute command blocks num_threads at a time, sharing one timeout"""
+            deadline = time.monotonic() + self.max_time
+            futures: List[Optional[Future]] = [None] * len(blocks)
+            waiting = deque(range(len(blocks)))
+            running: set = set()
+            while waiting or running:
+                while waiting and len(running) < self.num_threads:
+                    i = waiting.popleft()
+                    # Tools are not known to be thread-safe, so each
+                    # concurrent block gets its own instance
+                    futures[i] = _start_block(run_block, blocks[i], make_tool())
+                    running.add(futures[i])
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, running = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+            
+            results = []
+            for future in futures:
+                if future is None:
+                    # Slots stayed taken by blocks that never finished
+                    message = f"Execution not started within {self.max_time} seconds"
+                    logger.warning(message, tool_name=tool_name)
+                    results.append(message)
+                elif not future.done():
+                    results.append(timed_out())
+                elif future.exception() is not None:
+                    e = future.exception()
+                    logger.error(
+                        f"Error executing block: {str(e)}",
+                        tool_name=tool_name,
+                        exc_info=e
+                    )
+                    results.append(f"Error executing block: {str(e)}")
+                else:
+                    results.append(future.result())
+            return results
         
         logger.info(
             "Executing tool command",
@@ -434,38 +686,25 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
             logger.info(f"Executing MCP tool: {tool_name}")
             return asyncio.run(self._execute_mcp_tool(tool_name, command))
         
-        # Resolve tool name mapping
-        if tool_name in TOOL_NAME_MAPPING_LONG:
-            dir_name = TOOL_NAME_MAPPING_LONG[tool_name]["dir_name"]
-            class_name = TOOL_NAME_MAPPING_LONG[tool_name]["class_name"]
-        elif tool_name in TOOL_NAME_MAPPING_SHORT:
-            long_name = TOOL_NAME_MAPPING_SHORT[tool_name]
-            if long_name in TOOL_NAME_MAPPING_LONG:
-                dir_name = TOOL_NAME_MAPPING_LONG[long_name]["dir_name"]
-                class_name = TOOL_NAME_MAPPING_LONG[long_name]["class_name"]
-            else:
-                # Fallback
-                dir_name = tool_name.lower().replace('_tool', '')
-                class_name = tool_name
-        else:
-            # Fallback to original behavior for unmapped tools
-            dir_name = tool_name.lower().replace('_tool', '')
-            class_name = tool_name
+        # Resolve tool name mapping, falling back to the original behavior
+        # for unmapped tools
+        dir_name, class_name = TOOL_NAME_INDEX.get(tool_name) or (
+            tool_name.lower().replace('_tool', ''), tool_name
+        )
         
         module_name = f"tools.{dir_name}.tool"
         
         try:
-            # Dynamically import the module
-            module = importlib.import_module(module_name)
-            
-            # Get the tool class
-            tool_class = getattr(module, class_name)
+            # The class is resolved once per tool; instances are built per
+            # command, since abandoned blocks may still be running on old ones
+            tool_class = _load_tool_class(dir_name, class_name)
             
-            tool = tool_class()
-            
-            # Set the custom output directory
-            if self.query_cache_dir:
-                tool.set_custom_output_dir(self.query_cache_dir)
+            def make_tool() -> Any:
+                tool = tool_class()
+                # Set the custom output directory
+                if self.query_cache_dir:
+                    tool.set_custom_output_dir(self.query_cache_dir)
+                return tool
             
             # Split the command into blocks, execute each one
             command_blocks = split_commands(command)
@@ -476,13 +715,14 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
                 tool_name=tool_name
             )
             
-            for i, block in enumerate(command_blocks, 1):
-                # Create a local context to safely execute the block
-                local_context = {'tool': tool}
-                
-                # Execute the block with timeout protection
-                result = execute_with_timeout(block, local_context)
-                
+            # Blocks are independent tool calls (usually I/O-bound), so they
+            # can overlap when the executor has threads to spare
+            if self.num_threads > 1 and len(command_blocks) > 1:
+                results = execute_parallel(command_blocks, make_tool)
+            else:
+                results = execute_sequential(command_blocks, make_tool)
+            
+            for i, (block, result) in enumerate(zip(command_blocks, results), 1):
                 if result is not None:
                     executions.append(result)
                     logger.debug(
@@ -539,8 +779,7 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
             import ast
             
             # Find the execute call
-            execute_pattern = r'tool\.execute\(([^)]+)\)'
-            match = re.search(execute_pattern, command)
+            match = _EXECUTE_PATTERN.search(command)
             
             if not match:
                 return "Error: Could not parse MCP tool parameters"
@@ -586,8 +825,7 @@ execution = tool.execute(query=["Methanol", "function of hyperbola", "Fermat's L
         
         # Extract the query/input from the command
         # Try to extract parameters from tool.execute() call
-        execute_pattern = r'tool\.execute\(([^)]+)\)'
-        match = re.search(execute_pattern, command)
+        match = _EXECUTE_PATTERN.search(command)
         
         if match:
             params_str = match.group(1)
@@ -1,23 +0,0 @@
-"""Utilities for AgentFlow"""
-
-from agentflow.utils.logging import setup_logger
-from agentflow.utils.exceptions import (
-    AgentFlowError,
-    WorkflowError,
-    AgentExecutionError,
-    BedrockError,
-    ModelInvocationError,
-    ConfigurationError,
-    ValidationError
-)
-
-__all__ = [
-    "setup_logger",
-    "AgentFlowError",
-    "WorkflowError",
-    "AgentExecutionError",
-    "BedrockError",
-    "ModelInvocationError",
-    "ConfigurationError",
-    "ValidationError",
-]
@@ -2,12 +2,29 @@
 Logging utilities for AgentFlow
 """
 
+import json
 import logging
 import sys
 from typing import Any
 import structlog
 from pythonjsonlogger import jsonlogger
 
+# Try to import orjson for faster log serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """json.dumps-compatible serializer backed by orjson"""
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+    except TypeError:
+        # orjson rejects what json.dumps accepts, e.g. ints wider than 64 bits
+        return json.dumps(obj, **kwargs)
+
 
 def setup_logger(name: str) -> structlog.BoundLogger:
     """
@@ -31,7 +48,9 @@ def setup_logger(name: str) -> structlog.BoundLogger:
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if ORJSON_AVAILABLE else json.dumps
+            )
         ],
         wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         context_class=dict,
@@ -2,13 +2,16 @@
 Logging utilities for AgentFlow with CloudWatch integration
 """
 
+import json
 import logging
 import sys
 import os
-from typing import Any, Optional
+from typing import Optional
 import structlog
 from pythonjsonlogger import jsonlogger
 
+from agentflow.utils.logging import ORJSON_AVAILABLE, _orjson_dumps
+
 # Try to import watchtower for CloudWatch integration
 try:
     import watchtower
@@ -87,7 +90,9 @@ def setup_logger(name: str, enable_cloudwatch: bool = True) -> structlog.BoundLo
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if ORJSON_AVAILABLE else json.dumps
+            )
         ],
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
@@ -0,0 +1,90 @@
+"""
+Tests for Strands agents
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from botocore.exceptions import ClientError
+from agentflow.core.agent_strands import AgentConfig, SimpleAgent, ToolAgent
+from agentflow.models.bedrock_client import BedrockClient
+from agentflow.utils.exceptions import AgentExecutionError
+
+
+@pytest.fixture
+def mock_boto_client():
+    """Mock boto3 Bedrock client"""
+    with patch('boto3.client') as mock_client:
+        client = MagicMock()
+        mock_client.return_value = client
+        yield client
+
+
+class TestStrandsAgent:
+    """Test Strands agent execution"""
+
+    @pytest.mark.asyncio
+    async def test_throttling_retried_by_one_layer(self, mock_boto_client):
+        """Test a throttled call is attempted max_retries times in total"""
+        mock_boto_client.invoke_model.side_effect = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+            'InvokeModel'
+        )
+
+        agent = SimpleAgent(
+            config=AgentConfig(name="agent", max_retries=3),
+            bedrock_client=BedrockClient(max_retries=3),
+            prompt_template="Process: {input}"
+        )
+
+        with patch('asyncio.sleep', new=AsyncMock()):
+            with pytest.raises(AgentExecutionError, match="Rate exceeded"):
+                await agent.execute({"input": "x"})
+
+        assert mock_boto_client.invoke_model.call_count == 3
+
+    def test_tool_agent_reused_across_event_loops(self, mock_boto_client):
+        """Test contended tool calls work from several asyncio.run calls"""
+        async def lookup(tool_input):
+            await asyncio.sleep(0.01)
+            return tool_input["q"]
+
+        # One slot, so the second tool call waits on the semaphore and binds it
+        agent = ToolAgent(
+            config=AgentConfig(name="agent", max_parallel_tools=1),
+            bedrock_client=BedrockClient(),
+            prompt_template="Process: {input}",
+            tool_handlers={"lookup": lookup}
+        )
+        response = {"content": [
+            {"type": "tool_use", "name": "lookup", "input": {"q": "a"}},
+            {"type": "tool_use", "name": "lookup", "input": {"q": "b"}},
+        ]}
+
+        for _ in range(2):
+            results = asyncio.run(agent._process_response(response, {}))
+            assert results == [
+                {"tool": "lookup", "result": "a"},
+                {"tool": "lookup", "result": "b"},
+            ]
+
+    def test_config_with_nested_values_is_hashable(self, mock_boto_client):
+        """Test configs hash by value and frozen tools still serialize"""
+        def make_config():
+            return AgentConfig(
+                name="agent",
+                tools=[{"name": "lookup", "input_schema": {"required": ["q"]}}],
+                metadata={"tags": ["a", "b"]}
+            )
+
+        config = make_config()
+        assert hash(config) == hash(make_config())
+        assert config == make_config()
+        with pytest.raises(TypeError):
+            config.metadata["tags"] = ()
+
+        agent = SimpleAgent(
+            config=config, bedrock_client=BedrockClient(), prompt_template="Process: {input}"
+        )
+        assert json.loads(agent._tools_json)[0]["input_schema"] == {"required": ["q"]}
@@ -2,9 +2,10 @@
 Tests for Bedrock client
 """
 
+import asyncio
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from botocore.exceptions import ClientError
 from agentflow.models.bedrock_client import BedrockClient, ModelType
 from agentflow.utils.exceptions import BedrockError, ModelInvocationError
@@ -139,6 +140,9 @@ class TestBedrockClient:
                 model_type=ModelType.HAIKU_4_5,
                 prompt="Test"
             )
+        
+        # Non-retryable errors fail without backing off
+        assert mock_boto_client.invoke_model.call_count == 1
     
     @pytest.mark.asyncio
     async def test_invoke_throttling_error(self, mock_boto_client):
@@ -200,3 +204,69 @@ class TestBedrockClient:
         body = json.loads(call_args[1]['body'])
         
         assert body['temperature'] == 0.9
+    
+    def test_client_reused_across_event_loops(self, mock_boto_client):
+        """Test one client can serve several asyncio.run calls"""
+        def invoke_model(**kwargs):
+            body = MagicMock()
+            body.read.return_value = json.dumps({'content': [{'text': 'Response'}]}).encode()
+            return {'body': body}
+        
+        mock_boto_client.invoke_model.side_effect = invoke_model
+        
+        # One slot, so the second call waits on the semaphore and binds it
+        client = BedrockClient(max_concurrency=1)
+        
+        async def run():
+            return await asyncio.gather(
+                client.invoke(model_type=ModelType.HAIKU_4_5, prompt="a"),
+                client.invoke(model_type=ModelType.HAIKU_4_5, prompt="b")
+            )
+        
+        try:
+            for _ in range(2):
+                results = asyncio.run(run())
+                assert [r['content'][0]['text'] for r in results] == ['Response'] * 2
+        finally:
+            client.close()
+        
+        assert mock_boto_client.invoke_model.call_count == 4
+    
+    @pytest.mark.asyncio
+    async def test_streaming_retries_opening_on_throttling(self, mock_boto_client):
+        """Test a throttled stream is reopened before any chunk is yielded"""
+        body = MagicMock()
+        body.__iter__.return_value = iter([
+            {'chunk': {'bytes': json.dumps({'choices': [{'delta': {'content': 'hi'}}]}).encode()}}
+        ])
+        throttled = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+            'InvokeModelWithResponseStream'
+        )
+        mock_boto_client.invoke_model_with_response_stream.side_effect = [
+            throttled, {'body': body}
+        ]
+        
+        client = BedrockClient()
+        with patch('asyncio.sleep', new=AsyncMock()):
+            events = [
+                event async for event in client.invoke_with_streaming(
+                    model_type=ModelType.QWEN_3_32B, prompt="Test"
+                )
+            ]
+        
+        assert events == [
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "hi"}}
+        ]
+        assert mock_boto_client.invoke_model_with_response_stream.call_count == 2
+    
+    def test_botocore_sends_each_request_once(self):
+        """Test the real boto3 client is configured without its own retries"""
+        client = BedrockClient(region_name="us-east-1")
+        try:
+            assert client.client.meta.config.retries == {
+                'total_max_attempts': 1,
+                'mode': 'adaptive'
+            }
+        finally:
+            client.close()
@@ -0,0 +1,182 @@
+"""
+Tests for Bedrock tool executor
+"""
+
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from agentflow.models.bedrock_client import BedrockClient, ModelType
+from agentflow.models.executor_bedrock import Executor
+
+
+class FakeTool:
+    """Tool whose execute blocks until released when asked to hang"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def execute(self, query):
+        if query == "hang":
+            self.release.wait()
+        return f"done {query}"
+
+
+@pytest.fixture
+def fake_tool():
+    """Tool returned for every tool name"""
+    tool = FakeTool()
+    with patch(
+        'agentflow.models.executor_bedrock._load_tool_class',
+        return_value=lambda: tool
+    ):
+        yield tool
+    tool.release.set()
+
+
+@pytest.fixture
+def mock_boto_client():
+    """Mock boto3 Bedrock client"""
+    with patch('boto3.client') as mock_client:
+        client = MagicMock()
+        mock_client.return_value = client
+        yield client
+
+
+def make_executor(bedrock_client=None, **kwargs):
+    """Executor over a mock client by default, without MCP"""
+    kwargs.setdefault('model_type', ModelType.HAIKU_4_5)
+    return Executor(
+        bedrock_client=bedrock_client or Mock(spec=BedrockClient),
+        enable_mcp=False,
+        **kwargs
+    )
+
+
+def stream_body(chunks):
+    """Response stream body yielding the given chunks as events"""
+    body = MagicMock()
+    body.__iter__.return_value = iter(
+        [{'chunk': {'bytes': json.dumps(chunk).encode()}} for chunk in chunks]
+    )
+    return body
+
+
+class TestGenerateToolCommand:
+    """Test tool command generation"""
+
+    @pytest.mark.asyncio
+    async def test_qwen_openai_style_stream(self, mock_boto_client):
+        """Test Qwen choices[].delta.content chunks are collected"""
+        pieces = ["Generated Command:\n```python\n", 'execution = tool.execute(query="x")\n', "```"]
+        body = stream_body(
+            [{'choices': [{'delta': {'role': 'assistant'}}]}]
+            + [{'choices': [{'delta': {'content': piece}}]} for piece in pieces]
+        )
+        mock_boto_client.invoke_model_with_response_stream.return_value = {'body': body}
+        executor = make_executor(
+            BedrockClient(), model_type=ModelType.QWEN_3_32B, command_cache_size=0
+        )
+
+        command = await executor.generate_tool_command(
+            question="q", image=None, context="", sub_goal="g",
+            tool_name="Generalist_Solution_Generator_Tool", tool_metadata={}
+        )
+
+        assert command == "".join(pieces)
+        body.close.assert_called_once()
+
+
+class TestCommandCache:
+    """Test the persisted tool command cache"""
+
+    def test_cache_is_off_by_default(self, tmp_path):
+        """Test nothing is cached or written unless a size is given"""
+        executor = make_executor()
+        executor.set_query_cache_dir(str(tmp_path))
+
+        assert executor.command_cache_size == 0
+        assert not (tmp_path / "tool_cmd_cache.jsonl").exists()
+
+    def test_cache_file_is_compacted(self, tmp_path):
+        """Test the file is rewritten with live entries once it outgrows the cache"""
+        executor = make_executor(command_cache_size=2)
+        executor.set_query_cache_dir(str(tmp_path))
+
+        for i in range(10):
+            executor._cache_command(f"key{i}", f"command{i}")
+
+        lines = (tmp_path / "tool_cmd_cache.jsonl").read_text().splitlines()
+        assert len(lines) <= 4
+
+        reloaded = make_executor(command_cache_size=2)
+        reloaded.set_query_cache_dir(str(tmp_path))
+        assert list(reloaded._command_cache.items()) == [
+            ("key8", "command8"), ("key9", "command9")
+        ]
+
+
+class TestExecuteToolCommand:
+    """Test tool command execution"""
+
+    def test_hung_block_does_not_hold_up_later_commands(self, fake_tool):
+        """Test a timed-out block leaves later blocks free to run"""
+        executor = make_executor(max_time=0.2)
+
+        first = executor.execute_tool_command(
+            "Generalist_Solution_Generator_Tool", 'execution = tool.execute(query="hang")'
+        )
+        later = [
+            executor.execute_tool_command(
+                "Generalist_Solution_Generator_Tool", f'execution = tool.execute(query="{i}")'
+            )
+            for i in range(3)
+        ]
+
+        assert first == ["Execution timed out after 0.2 seconds"]
+        assert later == [["done 0"], ["done 1"], ["done 2"]]
+
+    def test_parallel_blocks_report_not_started(self, fake_tool):
+        """Test blocks still waiting for a slot are not reported as timed out"""
+        executor = make_executor(max_time=0.2, num_threads=2)
+
+        results = executor.execute_tool_command(
+            "Generalist_Solution_Generator_Tool",
+            'execution = tool.execute(query="hang")\n'
+            'execution = tool.execute(query="hang")\n'
+            'execution = tool.execute(query="x")'
+        )
+
+        assert results == [
+            "Execution timed out after 0.2 seconds",
+            "Execution timed out after 0.2 seconds",
+            "Execution not started within 0.2 seconds",
+        ]
+
+    def test_tool_instances_are_not_shared(self):
+        """Test concurrent blocks and separate commands each get their own tool"""
+        instances = []
+
+        class RecordingTool:
+            def __init__(self):
+                instances.append(self)
+
+            def execute(self, query):
+                return id(self)
+
+        executor = make_executor(num_threads=2)
+        with patch(
+            'agentflow.models.executor_bedrock._load_tool_class',
+            return_value=RecordingTool
+        ):
+            results = executor.execute_tool_command(
+                "Generalist_Solution_Generator_Tool",
+                'execution = tool.execute(query="a")\n'
+                'execution = tool.execute(query="b")'
+            )
+            executor.execute_tool_command(
+                "Generalist_Solution_Generator_Tool", 'execution = tool.execute(query="c")'
+            )
+
+        assert len(set(results)) == 2
+        assert len(instances) == 3
@@ -0,0 +1,73 @@
+"""
+Tests for MCP configuration
+"""
+
+import json
+import pytest
+from agentflow.mcp import mcp_config
+from agentflow.mcp.mcp_config import MCPConfig
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Workspace whose config levels come only from files the test writes"""
+    monkeypatch.setattr(mcp_config, "_USER_MCP_CONFIG_PATH", tmp_path / "user" / "mcp.json")
+    monkeypatch.delenv("AGENTFLOW_MCP_CONFIG", raising=False)
+    return tmp_path
+
+
+def write_servers(path, servers):
+    """Write an mcp.json declaring the given servers"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"mcpServers": servers}))
+
+
+def workspace_config_path(workspace):
+    """Workspace-level mcp.json path"""
+    return workspace / ".kiro" / "settings" / "mcp.json"
+
+
+class TestMCPConfig:
+    """Test MCP config loading and merging"""
+
+    def test_higher_level_narrows_auto_approve(self, workspace):
+        """Test a later level replaces autoApprove instead of adding to it"""
+        write_servers(workspace_config_path(workspace), {
+            "filesystem": {"command": "npx", "autoApprove": ["read_file", "write_file"]}
+        })
+        custom = workspace / "custom.json"
+        write_servers(custom, {"filesystem": {"autoApprove": ["read_file"]}})
+
+        config = MCPConfig(workspace_dir=str(workspace), config_path=str(custom))
+
+        assert config.get_server_config("filesystem")["command"] == "npx"
+        assert config.is_tool_auto_approved("filesystem", "read_file")
+        assert not config.is_tool_auto_approved("filesystem", "write_file")
+
+    def test_merged_disabled_drops_server(self, workspace):
+        """Test a later level can disable a server and re-enable one"""
+        write_servers(workspace_config_path(workspace), {
+            "filesystem": {"command": "npx"},
+            "github": {"command": "npx", "disabled": True}
+        })
+        custom = workspace / "custom.json"
+        write_servers(custom, {
+            "filesystem": {"disabled": True},
+            "github": {"disabled": False}
+        })
+
+        config = MCPConfig(workspace_dir=str(workspace), config_path=str(custom))
+
+        assert config.get_server_config("filesystem") is None
+        assert config.get_server_config("github")["command"] == "npx"
+
+    def test_config_loaded_on_first_access(self, workspace):
+        """Test files are read on first access, and only once"""
+        custom = workspace / "custom.json"
+        config = MCPConfig(workspace_dir=str(workspace), config_path=str(custom))
+
+        write_servers(custom, {"filesystem": {"command": "npx"}})
+        assert set(config.get_all_servers()) == {"filesystem"}
+
+        write_servers(custom, {"github": {"command": "npx"}})
+        assert set(config.get_all_servers()) == {"filesystem"}
@@ -0,0 +1,81 @@
+"""
+Tests for MCP tool loader
+"""
+
+import asyncio
+import pytest
+from agentflow.mcp.mcp_config import MCPConfig
+from agentflow.mcp.mcp_tool_loader import MCPToolLoader
+
+
+@pytest.fixture
+def mcp_config(tmp_path):
+    """MCP config with the filesystem server enabled"""
+    config_file = tmp_path / "mcp.json"
+    config_file.write_text(
+        '{"mcpServers": {"filesystem": '
+        '{"command": "npx", "autoApprove": ["read_file"], "maxConcurrent": 2}}}'
+    )
+    return MCPConfig(workspace_dir=str(tmp_path), config_path=str(config_file))
+
+
+class TestMCPToolLoader:
+    """Test MCP tool loading"""
+
+    @pytest.mark.asyncio
+    async def test_load_tools_registers_namespaced_tools(self, mcp_config):
+        """Test tools are registered under server-qualified names"""
+        loader = MCPToolLoader(mcp_config)
+        tools = await loader.load_tools(["filesystem"])
+
+        assert set(tools) == {
+            "filesystem.read_file",
+            "filesystem.write_file",
+            "filesystem.list_directory",
+        }
+        assert tools["filesystem.read_file"].name == "read_file"
+        assert tools["filesystem.read_file"].server_name == "filesystem"
+
+    @pytest.mark.asyncio
+    async def test_execute_respects_server_concurrency_limit(self, mcp_config):
+        """Test concurrent calls to one server are capped by maxConcurrent"""
+        loader = MCPToolLoader(mcp_config)
+        await loader.load_tools(["filesystem"])
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_execution(server_name, tool_name, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        loader._simulate_tool_execution = fake_execution
+        await asyncio.gather(
+            *(loader.execute_tool("filesystem.read_file", path="x") for _ in range(6))
+        )
+
+        assert peak == 2
+
+    def test_loader_reused_across_event_loops(self, mcp_config):
+        """Test contended server calls work from several asyncio.run calls"""
+        loader = MCPToolLoader(mcp_config)
+        asyncio.run(loader.load_tools(["filesystem"]))
+
+        async def fake_execution(server_name, tool_name, params):
+            await asyncio.sleep(0.01)
+            return {}
+
+        loader._simulate_tool_execution = fake_execution
+
+        async def run():
+            # More calls than maxConcurrent, so some wait on the semaphore
+            return await asyncio.gather(
+                *(loader.execute_tool("filesystem.read_file", path="x") for _ in range(4))
+            )
+
+        for _ in range(2):
+            assert asyncio.run(run()) == [{}] * 4
@@ -181,3 +181,35 @@ class TestWorkflow:
         assert execution_order[0] == ["step1"]
         assert set(execution_order[1]) == {"step2", "step3"}
         assert execution_order[2] == ["step4"]
+    
+    @pytest.mark.asyncio
+    async def test_execution_order_reused_until_step_added(self, mock_agent):
+        """Test validation runs once per graph change"""
+        workflow = Workflow(WorkflowConfig(name="test"))
+        workflow.add_step("step1", mock_agent, {})
+        
+        with patch.object(
+            workflow, "_validate_workflow", wraps=workflow._validate_workflow
+        ) as validate:
+            await workflow.execute()
+            await workflow.execute()
+            assert validate.call_count == 1
+            
+            workflow.add_step("step2", mock_agent, {}, dependencies=["step1"])
+            result = await workflow.execute()
+            assert validate.call_count == 2
+        
+        assert set(result["results"]) == {"step1", "step2"}
+    
+    @pytest.mark.asyncio
+    async def test_metrics_reset_between_runs(self, mock_agent):
+        """Test a second execute reports only its own run"""
+        workflow = Workflow(WorkflowConfig(name="test"))
+        workflow.add_step("step1", mock_agent, {})
+        
+        first = await workflow.execute()
+        second = await workflow.execute()
+        
+        assert second["metrics"]["completed_steps"] == 1
+        assert len(second["execution_history"]) == 1
+        assert len(first["execution_history"]) == 1